@@ -0,0 +1,134 @@
+"""
+TTL Cache
+---------
+A tiny in-process cache for API responses that change on the order of
+minutes (site lists, quotas, crawl stats). Entries expire `ttl` seconds
+after they are stored; the oldest entry is evicted once `maxsize` is hit.
+
+get_or_fetch() adds single-flight loading: concurrent misses on the same
+key share one upstream call instead of each sending their own. A cache
+built with `stale` > 0 also serves stale-while-revalidate: for `stale`
+seconds past expiry an entry is still returned at once while a background
+fetch replaces it.
+
+env_ttl() lets a lifetime be overridden from the environment.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def env_ttl(name: str, default: float) -> float:
+    """
+    Cache lifetime in seconds from environment variable `name`.
+
+    Falls back to `default` when the variable is unset, not a number or
+    negative (0 disables caching: entries expire as soon as they are set).
+    """
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        ttl = float(raw)
+    except ValueError:
+        ttl = -1.0
+    if ttl < 0:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}s")
+        return default
+    return ttl
+
+
+class TTLCache:
+    """
+    Dict-backed cache whose entries expire `ttl` seconds after being set.
+
+    Expired entries are kept `stale` more seconds for get_or_fetch() to
+    serve while it refreshes them; get() never returns them.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, stale: float = 0):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale = stale
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        now = time.monotonic()
+        if now >= expires:
+            if now >= expires + self.stale:
+                del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (default: the cache's ttl)."""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # dicts keep insertion order — drop the oldest entry
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """
+        Return the cached value for `key`, or await `fetch()` and cache it.
+
+        Callers that miss while a fetch for the same key is already running
+        wait for that one instead of starting another. Failures are not
+        cached; every waiter sees the exception.
+
+        An entry expired less than `stale` seconds ago is returned as is,
+        and the fetch runs in the background to replace it. A failed
+        background fetch is only logged; the stale entry stays until its
+        window ends.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._fetched(key, t, ttl))
+
+        entry = self._data.get(key)
+        if entry is not None:
+            # get() kept it, so it is within its stale window
+            return entry[1]
+        # shield: one cancelled caller mustn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _fetched(self, key: Hashable, task: asyncio.Future, ttl: float | None) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            self.set(key, task.result(), ttl)
+        elif key in self._data:
+            logger.debug(f"Background refresh of {key!r} failed: {exc}")
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop one entry, or everything when `key` is None."""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
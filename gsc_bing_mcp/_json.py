@@ -0,0 +1,54 @@
+"""
+JSON helpers
+------------
+Thin wrappers around orjson (a C/Rust JSON codec, several times faster than
+the stdlib on the large list-of-dict payloads GSC and Bing return, and on
+encoding request bodies).
+
+orjson only accepts strict JSON with 64-bit integers; anything it rejects is
+re-parsed with the stdlib so behaviour matches json.loads exactly.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching json.JSONDecodeError.
+
+Large payloads are decoded in a worker thread (loads_async) so a multi-MB
+response doesn't stall the event loop while other tool calls are in flight.
+"""
+
+import asyncio
+import json
+
+import orjson
+
+# Payloads at least this big are decoded off the event loop. Below it the
+# thread hand-off (tens of µs) costs more than orjson spends decoding.
+OFFLOAD_THRESHOLD = 64 * 1024
+
+
+def loads(data: bytes | str):
+    """Decode JSON from bytes or str, preferring orjson."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Encode `obj` as compact JSON text with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def dumps_pretty(obj) -> str:
+    """
+    Encode `obj` as 2-space indented JSON text (tool responses).
+
+    Unlike json.dumps, non-ASCII is written as-is rather than \\u-escaped,
+    and NaN/Infinity become null.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+async def loads_async(data: bytes | str):
+    """Decode JSON like loads(), in a worker thread when the payload is large."""
+    if len(data) < OFFLOAD_THRESHOLD:
+        return loads(data)
+    return await asyncio.to_thread(loads, data)
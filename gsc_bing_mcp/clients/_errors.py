@@ -0,0 +1,63 @@
+"""
+HTTP Error Messages
+-------------------
+One status → message table per service, shared by the API clients so that
+known error statuses are turned into actionable RuntimeErrors with a single
+dict lookup instead of an if/elif chain.
+"""
+
+import httpx
+
+# Message templates keyed by service, then HTTP status.
+# "{context}" is filled in with the caller's description of the request.
+_STATUS_MESSAGES: dict[str, dict[int, str]] = {
+    "bing": {
+        401: (
+            "Bing API key is invalid or expired ({context}). "
+            "Please regenerate your API key at bing.com/webmasters → Settings → API Access."
+        ),
+        403: (
+            "Access denied for Bing API ({context}). "
+            "Make sure your API key has access to this site."
+        ),
+        404: (
+            "Bing Webmaster resource not found ({context}). "
+            "Check that the site URL is added and verified in Bing Webmaster Tools."
+        ),
+        429: (
+            "Bing API rate limit exceeded ({context}). "
+            "Please wait a moment and try again."
+        ),
+    },
+    "gsc": {
+        401: (
+            "Google session expired. Please re-open Chrome and log in to Google, "
+            "then try again. The MCP server will pick up fresh cookies automatically."
+        ),
+        403: (
+            "Access denied by Google (403). Your session cookies may be stale. "
+            "Re-open Chrome, visit search.google.com/search-console, and try again."
+        ),
+        429: "Rate limited by Google. Please wait a moment and try again.",
+    },
+}
+
+
+def raise_for_known_status(
+    response: httpx.Response, service: str, context: str = ""
+) -> None:
+    """
+    Raise a descriptive RuntimeError if the response has a known error status.
+
+    Args:
+        response: The HTTP response to check
+        service: "bing" or "gsc" — selects the message table
+        context: Short description of the request, used in Bing messages
+
+    Raises:
+        RuntimeError: If the status code has a message for this service.
+        Other statuses (including unknown errors) are left to the caller.
+    """
+    message = _STATUS_MESSAGES[service].get(response.status_code)
+    if message is not None:
+        raise RuntimeError(message.format(context=context))
@@ -0,0 +1,291 @@
+"""
+Shared HTTP Client Factory
+--------------------------
+Both API clients keep one long-lived httpx.AsyncClient each, so TCP + TLS
+connections are pooled and reused across tool calls instead of being
+re-established on every request. HTTP/2 is enabled so concurrent calls to
+the same host multiplex over a single connection (requires `h2`, pulled in
+by the `httpx[http2]` extra).
+
+Requests go through request_with_retry(), which applies a per-API token
+bucket (or a sliding window for per-minute quotas) and retries throttled /
+transiently failing responses with exponential backoff (honouring
+Retry-After when the server sends one).
+An optional ConcurrencyLimiter caps requests in flight, shrinking the cap
+when the API pushes back and growing it again while requests succeed
+(AIMD), so a burst of tool calls can't pile onto a throttled API.
+"""
+
+import asyncio
+import logging
+import random
+import socket
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing shared by the Bing and GSC clients; idle
+# connections are kept for a minute so back-to-back tool calls reuse them
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0
+)
+
+# Connection-level retries (connect errors / resets before a response)
+CONNECT_RETRIES = 3
+
+# OS-level TCP keepalive so idle pooled sockets aren't silently dropped
+SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+# ─── Retry policy ─────────────────────────────────────────────────────────────
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# For non-idempotent requests (Bing URL submissions): a 5xx may arrive after
+# the server already acted on the request, but a 429 means it was refused
+THROTTLE_STATUSES = frozenset({429})
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0   # seconds; doubles every attempt
+MAX_RETRY_WAIT = 8.0  # never sleep longer than this between attempts
+
+
+def new_async_client(timeout: float, **kwargs) -> httpx.AsyncClient:
+    """
+    Create a pooled AsyncClient with the project-wide connection settings.
+
+    `timeout` bounds reads; connecting, writing and waiting for a pooled
+    connection get short fixed budgets so one stalled call can't hold up
+    the rest.
+
+    Args:
+        timeout: Read timeout in seconds
+        **kwargs: Extra httpx.AsyncClient options (headers, follow_redirects, ...)
+
+    Returns:
+        A new httpx.AsyncClient — callers own it and must aclose() it
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=POOL_LIMITS,
+        retries=CONNECT_RETRIES,
+        socket_options=SOCKET_OPTIONS,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(timeout, connect=5.0, write=10.0, pool=5.0),
+        **kwargs,
+    )
+
+
+class RateLimiter:
+    """
+    Async token bucket: allows `rate` requests per `per` seconds, with
+    bursts of up to `rate` requests when the bucket is full.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._fill_rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+
+class SlidingWindowLimiter:
+    """
+    Async limiter allowing at most `rate` requests in any `window`-second
+    span. Stricter than RateLimiter, whose full bucket plus refill can let
+    nearly twice `rate` through in the first window; used for per-minute
+    quotas.
+    """
+
+    def __init__(self, rate: int, window: float = 60.0):
+        self._rate = rate
+        self._window = window
+        self._sent: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until sending one more request stays within the window, then record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self._window:
+                    self._sent.popleft()
+                if len(self._sent) < self._rate:
+                    self._sent.append(now)
+                    return
+                await asyncio.sleep(self._window - (now - self._sent[0]))
+
+
+class ConcurrencyLimiter:
+    """
+    Cap on in-flight requests, adjusted by AIMD (additive increase,
+    multiplicative decrease).
+
+    Each successful request raises the cap by 1/cap, i.e. about one slot
+    per cap's worth of completions; a throttled or timed-out request halves
+    it. The cap stays within [minimum, maximum].
+    """
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self._limit = float(initial)
+        self._min = minimum
+        self._max = maximum
+        self._active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, then take it."""
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            else:
+                # Cancelled just after being handed a slot — pass it on
+                self._active -= 1
+                self._wake()
+            raise
+
+    def release(self, congested: bool = False) -> None:
+        """Give a slot back, shrinking the cap if the request hit `congested`."""
+        self._active -= 1
+        if congested:
+            self._limit = max(self._min, self._limit / 2)
+        else:
+            self._limit = min(self._max, self._limit + 1 / self._limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in FIFO order."""
+        while self._waiters and self._active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """
+    Seconds to wait per a Retry-After header: either delta-seconds or an
+    HTTP-date. None if the value is unparseable (caller falls back to backoff).
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """
+    Seconds to wait before retrying `response`, or None to give up.
+
+    A Retry-After header (delta-seconds or HTTP-date) wins; otherwise
+    exponential backoff with jitter. Waits longer than MAX_RETRY_WAIT are
+    not worth blocking a tool call on, so those return None and the error
+    surfaces immediately.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        delay = _parse_retry_after(retry_after)
+        if delay is not None:
+            return delay if delay <= MAX_RETRY_WAIT else None
+    return min(MAX_RETRY_WAIT, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    limiter: RateLimiter | SlidingWindowLimiter | None = None,
+    concurrency: ConcurrencyLimiter | None = None,
+    retry_statuses: frozenset[int] = RETRY_STATUSES,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Send a request, rate-limited and retried on `retry_statuses`.
+
+    Args:
+        client: The AsyncClient to send with
+        method: HTTP method ("GET", "POST", ...)
+        url: Request URL
+        limiter: Optional RateLimiter / SlidingWindowLimiter gating every attempt
+        concurrency: Optional ConcurrencyLimiter holding a slot per attempt;
+                     RETRY_STATUSES responses and timeouts shrink its cap
+        retry_statuses: Statuses worth resending the request for; pass
+                        THROTTLE_STATUSES for requests that must not be
+                        replayed once the server may have processed them
+        **kwargs: Passed through to client.request()
+
+    Returns:
+        The final httpx.Response — callers still check its status, so an
+        exhausted 429 reaches their usual "rate limited" error message.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter is not None:
+            await limiter.acquire()
+        if concurrency is None:
+            response = await client.request(method, url, **kwargs)
+        else:
+            await concurrency.acquire()
+            congested = False
+            try:
+                response = await client.request(method, url, **kwargs)
+                congested = response.status_code in RETRY_STATUSES
+            except httpx.TimeoutException:
+                congested = True
+                raise
+            finally:
+                concurrency.release(congested)
+        if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+            return response
+
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        logger.debug(
+            f"HTTP {response.status_code} from {response.url.host}; "
+            f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+
+    return response
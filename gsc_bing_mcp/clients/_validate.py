@@ -0,0 +1,80 @@
+"""
+Input Normalization
+-------------------
+Cheap, memoized checks for the site URLs and dates passed to the API
+clients. Bad input fails fast with a clear message instead of costing a
+round trip, and repeat values (the common case when paging or fanning out
+over one property) are a single cache hit.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@lru_cache(maxsize=256)
+def normalize_site_url(site_url: str) -> str:
+    """
+    Normalize a property URL the way GSC/Bing list it.
+
+    - Surrounding whitespace is stripped
+    - Scheme and host are lowercased
+    - A bare host gets its trailing slash ("https://a.com" → "https://a.com/")
+    - "sc-domain:" properties are only lowercased
+
+    Anything else (paths, query strings) is left exactly as given.
+    """
+    site_url = site_url.strip()
+    if site_url.lower().startswith("sc-domain:"):
+        return site_url.lower()
+
+    parts = urlsplit(site_url)
+    if not parts.scheme or not parts.netloc:
+        return site_url
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or "/",
+        parts.query,
+        parts.fragment,
+    ))
+
+
+@lru_cache(maxsize=1024)
+def validate_date(date_str: str) -> str:
+    """
+    Check that a date is a real calendar date in YYYY-MM-DD format.
+
+    Returns:
+        The date string, unchanged
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    if not _DATE_RE.match(date_str):
+        raise ValueError(f"Invalid date {date_str!r}. Use YYYY-MM-DD format.")
+    try:
+        datetime.date.fromisoformat(date_str)
+    except ValueError:
+        raise ValueError(f"Invalid date {date_str!r}: no such calendar day.") from None
+    return date_str
+
+
+# GSC and Bing keep revising the most recent days' numbers for about this long
+DATA_SETTLE_DAYS = 3
+
+
+def is_settled_date(date_str: str | None) -> bool:
+    """
+    True if data up to `date_str` is final (older than DATA_SETTLE_DAYS).
+
+    Responses for a settled range never change, so they can be cached for
+    much longer. A missing date means "up to now" and is never settled.
+    """
+    if not date_str:
+        return False
+    cutoff = datetime.date.today() - datetime.timedelta(days=DATA_SETTLE_DAYS)
+    return datetime.date.fromisoformat(date_str) < cutoff
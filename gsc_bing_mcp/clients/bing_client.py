@@ -8,12 +8,26 @@ API Base: https://ssl.bing.com/webmaster/api.svc/json
 Docs: https://learn.microsoft.com/en-us/bingwebmaster/
 """
 
+import asyncio
 import os
 import logging
-from typing import Optional
-from urllib.parse import quote
+from functools import lru_cache
 
 import httpx
+import orjson
+
+from ._errors import raise_for_known_status
+from ._http import (
+    THROTTLE_STATUSES,
+    ConcurrencyLimiter,
+    RateLimiter,
+    SlidingWindowLimiter,
+    new_async_client,
+    request_with_retry,
+)
+from ._validate import is_settled_date, normalize_site_url, validate_date
+from .._cache import TTLCache, env_ttl
+from .._json import loads, loads_async
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +36,117 @@ BING_API_BASE = "https://ssl.bing.com/webmaster/api.svc/json"
 # Default timeout for API requests (seconds)
 REQUEST_TIMEOUT = 30.0
 
+# Max in-flight requests for the *_batch / *_all fan-out helpers
+BATCH_CONCURRENCY = 16
+
+# Upper bound on pages fetched by the *_all pagination helpers
+MAX_PAGES = 50
+
+# submit_url() coalescing: wait this long for more URLs, cap per batch
+SUBMIT_FLUSH_INTERVAL = 0.05
+SUBMIT_BATCH_MAX = 500
+
+# Client-side request rate ceiling (requests per second). Setting BING_RPM
+# replaces it with a per-minute budget, for keys with a tighter quota.
+RATE_LIMIT_PER_SECOND = 10
+
+# Requests in flight: starts at CONCURRENCY_INITIAL, adapts between 1 and
+# CONCURRENCY_MAX as the API accepts or throttles requests
+CONCURRENCY_INITIAL = 8
+CONCURRENCY_MAX = 32
+
+# Response cache lifetimes (seconds)
+SITES_CACHE_TTL = env_ttl("BING_SITES_TTL", 300)  # site list changes rarely
+SITE_STATS_CACHE_TTL = 60  # quota / crawl stats per site
+STATS_CACHE_TTL = 60                # analytics pages that include recent days
+SETTLED_STATS_CACHE_TTL = 24 * 3600  # analytics pages for a settled range
+REPORT_CACHE_TTL = env_ttl("BING_REPORT_CACHE_TTL", 1800)  # page stats, crawl issues, links, URL info
+# How long past expiry the quota / link counts are still served while a
+# background request refreshes them (stale-while-revalidate)
+QUOTA_STALE_TTL = 240
+LINKS_STALE_TTL = REPORT_CACHE_TTL
+
 # User-Agent for Bing API requests
 USER_AGENT = (
     "Mozilla/5.0 (compatible; gsc-bing-mcp/1.0; "
     "+https://github.com/codermillat/gsc-bing-mcp)"
 )
 
-
+# Static request headers: the shared client sends these on every request,
+# POSTs add a JSON content type
+_DEFAULT_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+_POST_HEADERS = {"Content-Type": "application/json"}
+
+# Endpoint URLs
+_URL_GET_USER_SITES = f"{BING_API_BASE}/GetUserSites"
+_URL_GET_RANK_AND_TRAFFIC_STATS = f"{BING_API_BASE}/GetRankAndTrafficStats"
+_URL_GET_CRAWL_STATS = f"{BING_API_BASE}/GetCrawlStats"
+_URL_GET_KEYWORD_STATS = f"{BING_API_BASE}/GetKeywordStats"
+_URL_GET_URL_INFO = f"{BING_API_BASE}/GetUrlInfo"
+_URL_GET_PAGE_STATS = f"{BING_API_BASE}/GetPageStats"
+_URL_SUBMIT_URL = f"{BING_API_BASE}/SubmitUrl"
+_URL_SUBMIT_URL_BATCH = f"{BING_API_BASE}/SubmitUrlBatch"
+_URL_GET_CRAWL_ISSUES = f"{BING_API_BASE}/GetCrawlIssues"
+_URL_GET_URL_SUBMISSION_QUOTA = f"{BING_API_BASE}/GetUrlSubmissionQuota"
+_URL_GET_LINK_COUNTS = f"{BING_API_BASE}/GetLinkCounts"
+
+# ─── Shared HTTP client ───────────────────────────────────────────────────────
+
+_client: httpx.AsyncClient | None = None
+
+
+def _make_rate_limiter() -> RateLimiter | SlidingWindowLimiter:
+    """Limiter for Bing requests: BING_RPM per minute if set, else RATE_LIMIT_PER_SECOND."""
+    rpm = os.environ.get("BING_RPM", "").strip()
+    if rpm:
+        if rpm.isdigit() and int(rpm) > 0:
+            return SlidingWindowLimiter(int(rpm), window=60.0)
+        logger.warning(f"Ignoring invalid BING_RPM={rpm!r}")
+    return RateLimiter(RATE_LIMIT_PER_SECOND)
+
+
+_rate_limiter = _make_rate_limiter()
+_concurrency = ConcurrencyLimiter(CONCURRENCY_INITIAL, CONCURRENCY_MAX)
+
+# ─── Response caches ──────────────────────────────────────────────────────────
+
+_sites_cache = TTLCache(SITES_CACHE_TTL, maxsize=1)
+_crawl_stats_cache = TTLCache(SITE_STATS_CACHE_TTL)
+_quota_cache = TTLCache(SITE_STATS_CACHE_TTL, stale=QUOTA_STALE_TTL)
+# Pages of traffic / keyword stats, keyed by (endpoint, site, dates, page, count)
+_stats_cache = TTLCache(STATS_CACHE_TTL, maxsize=256)
+# Per-site reports Bing recomputes every few hours, keyed by (endpoint, params);
+# URL info is kept apart so URL submissions can drop it without the rest
+_report_cache = TTLCache(REPORT_CACHE_TTL)
+_url_info_cache = TTLCache(REPORT_CACHE_TTL, maxsize=512)
+_links_cache = TTLCache(REPORT_CACHE_TTL, stale=LINKS_STALE_TTL)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = new_async_client(REQUEST_TIMEOUT, headers=_DEFAULT_HEADERS)
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared AsyncClient (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@lru_cache(maxsize=1)
 def get_bing_api_key() -> str:
     """
     Get the Bing Webmaster API key from environment variable.
 
+    The key is read once and memoized for the life of the process (the MCP
+    client sets the environment at launch). A missing key is not cached, so
+    the check is repeated until it succeeds.
+
     Returns:
         The API key string
 
@@ -58,58 +172,105 @@ def _handle_response_error(response: httpx.Response, context: str) -> None:
     if response.status_code == 200:
         return
 
-    if response.status_code == 401:
-        raise RuntimeError(
-            f"Bing API key is invalid or expired ({context}). "
-            "Please regenerate your API key at bing.com/webmasters → Settings → API Access."
-        )
-    if response.status_code == 403:
-        raise RuntimeError(
-            f"Access denied for Bing API ({context}). "
-            "Make sure your API key has access to this site."
-        )
-    if response.status_code == 429:
-        raise RuntimeError(
-            f"Bing API rate limit exceeded ({context}). "
-            "Please wait a moment and try again."
-        )
-    if response.status_code == 404:
-        raise RuntimeError(
-            f"Bing Webmaster resource not found ({context}). "
-            "Check that the site URL is added and verified in Bing Webmaster Tools."
-        )
+    raise_for_known_status(response, "bing", context)
 
-    # Try to parse Bing error response
-    try:
-        error_data = response.json()
-        error_msg = error_data.get("Message") or error_data.get("message") or response.text[:200]
-    except Exception:
-        error_msg = response.text[:200]
+    # Only JSON bodies carry a Bing error message; gateway 5xx pages are
+    # HTML/plain text, so skip the parse attempt for those
+    error_msg = response.text[:200]
+    if "json" in response.headers.get("content-type", ""):
+        try:
+            error_data = loads(response.content)
+        except ValueError:
+            error_data = None
+        if isinstance(error_data, dict):
+            error_msg = error_data.get("Message") or error_data.get("message") or error_msg
 
     raise RuntimeError(
         f"Bing Webmaster API error {response.status_code} ({context}): {error_msg}"
     )
 
 
+async def _bing_get(url: str, params: dict, context: str, default):
+    """
+    GET a Bing API endpoint and return its "d" payload.
+
+    Args:
+        url: Endpoint URL (one of the _URL_* constants)
+        params: Query parameters; the API key is added here
+        context: Short description used in error messages
+        default: Returned when the payload is missing or empty
+
+    Returns:
+        response["d"], or `default`
+    """
+    params["apikey"] = get_bing_api_key()
+    response = await request_with_retry(
+        _get_client(), "GET", url,
+        limiter=_rate_limiter, concurrency=_concurrency, params=params,
+    )
+    _handle_response_error(response, context)
+    data = await loads_async(response.content)
+    return data.get("d") or default
+
+
+async def _cached_bing_get(
+    cache: TTLCache, url: str, params: dict, context: str, default
+):
+    """
+    _bing_get() through `cache`, keyed by endpoint and query parameters.
+
+    Concurrent identical requests share one call. Results are shared
+    between callers — treat as read-only.
+    """
+    key = (url, *params.items())
+    return await cache.get_or_fetch(key, lambda: _bing_get(url, params, context, default))
+
+
+async def _bing_post(url: str, payload: dict, context: str, fallback: dict) -> dict:
+    """
+    POST a JSON payload to a Bing API endpoint.
+
+    Only 429s are retried: the POST endpoints submit URLs, and replaying
+    one after a 5xx the server may already have acted on would spend the
+    submission quota twice.
+
+    Args:
+        url: Endpoint URL (one of the _URL_* constants)
+        payload: JSON body
+        context: Short description used in error messages
+        fallback: Returned when the response body is not JSON
+
+    Returns:
+        The decoded response body, or `fallback`
+    """
+    response = await request_with_retry(
+        _get_client(), "POST", url,
+        limiter=_rate_limiter, concurrency=_concurrency,
+        params={"apikey": get_bing_api_key()},
+        content=orjson.dumps(payload),
+        headers=_POST_HEADERS,
+        retry_statuses=THROTTLE_STATUSES,
+    )
+    _handle_response_error(response, context)
+    try:
+        return loads(response.content)
+    except ValueError:
+        return fallback
+
+
 async def get_user_sites() -> list[dict]:
     """
     List all sites/properties in Bing Webmaster Tools.
 
+    Results are cached for SITES_CACHE_TTL seconds; concurrent calls share
+    one request.
+
     Returns:
         List of site dicts with keys: Url, Favicon, followed
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetUserSites",
-            params={"apikey": api_key},
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, "get_user_sites")
-    data = response.json()
-    return data.get("d", []) or []
+    return await _sites_cache.get_or_fetch(
+        "sites", lambda: _bing_get(_URL_GET_USER_SITES, {}, "get_user_sites", [])
+    )
 
 
 async def get_search_analytics(
@@ -132,52 +293,137 @@ async def get_search_analytics(
     Returns:
         List of stats dicts with keys: Date, Impressions, Clicks, AvgClickPosition
     """
-    api_key = get_bing_api_key()
+    site_url = normalize_site_url(site_url)
+    validate_date(start_date)
+    validate_date(end_date)
+    return await _cached_stats_page(
+        _URL_GET_RANK_AND_TRAFFIC_STATS,
+        site_url, start_date, end_date, page, max_count,
+        f"get_search_analytics for {site_url}",
+    )
+
+
+async def _cached_stats_page(
+    url: str,
+    site_url: str,
+    start_date: str,
+    end_date: str,
+    page: int,
+    max_count: int,
+    context: str,
+) -> list[dict]:
+    """
+    Fetch one page of a date-ranged stats endpoint through _stats_cache.
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetRankAndTrafficStats",
-            params={
-                "apikey": api_key,
+    Pages for a settled range (see is_settled_date) are kept for a day,
+    others for STATS_CACHE_TTL; concurrent identical requests share one
+    call. Treat the returned list as read-only.
+    """
+    ttl = SETTLED_STATS_CACHE_TTL if is_settled_date(end_date) else STATS_CACHE_TTL
+    return await _stats_cache.get_or_fetch(
+        (url, site_url, start_date, end_date, page, max_count),
+        lambda: _bing_get(
+            url,
+            {
                 "siteUrl": site_url,
                 "startDate": start_date,
                 "endDate": end_date,
                 "page": page,
                 "count": max_count,
             },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
+            context,
+            [],
+        ),
+        ttl,
+    )
+
 
-    _handle_response_error(response, f"get_search_analytics for {site_url}")
-    data = response.json()
-    return data.get("d", []) or []
+async def _fetch_all_pages(fetch_page, page_size: int) -> list[dict]:
+    """
+    Collect every page of a paginated Bing endpoint.
+
+    Page 0 is fetched alone; if it comes back full, later pages are
+    requested BATCH_CONCURRENCY at a time until a short page (the last
+    one) is seen or MAX_PAGES is reached.
+
+    Args:
+        fetch_page: Coroutine function taking a 0-indexed page number
+        page_size: Rows requested per page
+
+    Returns:
+        All rows, in page order
+    """
+    rows = await fetch_page(0)
+    if len(rows) < page_size:
+        return rows
+    rows = list(rows)  # pages may be shared cache entries; extend a copy
+
+    page = 1
+    while page < MAX_PAGES:
+        batch = range(page, min(page + BATCH_CONCURRENCY, MAX_PAGES))
+        results = await asyncio.gather(*(fetch_page(p) for p in batch))
+        for page_rows in results:
+            rows.extend(page_rows)
+            if len(page_rows) < page_size:
+                return rows
+        page += len(batch)
+
+    logger.warning(f"Stopped paginating after {MAX_PAGES} pages")
+    return rows
+
+
+async def get_search_analytics_all(
+    site_url: str,
+    start_date: str,
+    end_date: str,
+    max_count: int = 100,
+) -> list[dict]:
+    """
+    Get every page of search performance data from Bing for a site.
+
+    Same as get_search_analytics(), but walks all pages concurrently.
+
+    Args:
+        site_url: The site URL (e.g., "https://example.com/")
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        max_count: Rows per page request
+
+    Returns:
+        List of stats dicts with keys: Date, Impressions, Clicks, AvgClickPosition
+    """
+    site_url = normalize_site_url(site_url)
+    validate_date(start_date)
+    validate_date(end_date)
+    return await _fetch_all_pages(
+        lambda page: get_search_analytics(site_url, start_date, end_date, page, max_count),
+        max_count,
+    )
 
 
 async def get_crawl_stats(site_url: str) -> dict:
     """
     Get crawl statistics and errors for a site in Bing.
 
+    Results are cached per site for SITE_STATS_CACHE_TTL seconds; concurrent
+    calls for the same site share one request.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
 
     Returns:
         Dict with crawl stats: CrawledPages, TotalCrawledUrls, etc.
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetCrawlStats",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, f"get_crawl_stats for {site_url}")
-    data = response.json()
-    return data.get("d") or {}
+    site_url = normalize_site_url(site_url)
+    return await _crawl_stats_cache.get_or_fetch(
+        site_url,
+        lambda: _bing_get(
+            _URL_GET_CRAWL_STATS,
+            {"siteUrl": site_url},
+            f"get_crawl_stats for {site_url}",
+            {},
+        ),
+    )
 
 
 async def get_keyword_stats(
@@ -200,31 +446,52 @@ async def get_keyword_stats(
     Returns:
         List of keyword dicts with keys: Query, Impressions, Clicks, AvgClickPosition
     """
-    api_key = get_bing_api_key()
+    site_url = normalize_site_url(site_url)
+    validate_date(start_date)
+    validate_date(end_date)
+    return await _cached_stats_page(
+        _URL_GET_KEYWORD_STATS,
+        site_url, start_date, end_date, page, max_count,
+        f"get_keyword_stats for {site_url}",
+    )
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetKeywordStats",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-                "startDate": start_date,
-                "endDate": end_date,
-                "page": page,
-                "count": max_count,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
 
-    _handle_response_error(response, f"get_keyword_stats for {site_url}")
-    data = response.json()
-    return data.get("d", []) or []
+async def get_keyword_stats_all(
+    site_url: str,
+    start_date: str,
+    end_date: str,
+    max_count: int = 100,
+) -> list[dict]:
+    """
+    Get every page of keyword statistics from Bing for a site.
+
+    Same as get_keyword_stats(), but walks all pages concurrently.
+
+    Args:
+        site_url: The site URL (e.g., "https://example.com/")
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        max_count: Rows per page request
+
+    Returns:
+        List of keyword dicts with keys: Query, Impressions, Clicks, AvgClickPosition
+    """
+    site_url = normalize_site_url(site_url)
+    validate_date(start_date)
+    validate_date(end_date)
+    return await _fetch_all_pages(
+        lambda page: get_keyword_stats(site_url, start_date, end_date, page, max_count),
+        max_count,
+    )
 
 
 async def get_url_info(site_url: str, page_url: str) -> dict:
     """
     Get detailed information about a specific URL in Bing.
 
+    Results are cached for REPORT_CACHE_TTL seconds; submitting URLs
+    drops the cached entries.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
         page_url: The specific page URL to inspect
@@ -232,55 +499,78 @@ async def get_url_info(site_url: str, page_url: str) -> dict:
     Returns:
         Dict with URL info: CrawlDate, HttpStatusCode, indexed, etc.
     """
-    api_key = get_bing_api_key()
+    site_url = normalize_site_url(site_url)
+    return await _cached_bing_get(
+        _url_info_cache,
+        _URL_GET_URL_INFO,
+        {"siteUrl": site_url, "url": page_url},
+        f"get_url_info for {page_url}",
+        {},
+    )
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetUrlInfo",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-                "url": page_url,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
 
-    _handle_response_error(response, f"get_url_info for {page_url}")
-    data = response.json()
-    return data.get("d") or {}
+async def get_url_info_batch(
+    site_url: str,
+    page_urls: list[str],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> list[dict | Exception]:
+    """
+    Get URL info for many pages concurrently.
+
+    Requests run in parallel (at most `concurrency` in flight) over the
+    shared client, so N lookups take roughly ceil(N / concurrency) round
+    trips instead of N.
+
+    Args:
+        site_url: The site URL (e.g., "https://example.com/")
+        page_urls: The page URLs to inspect
+        concurrency: Max simultaneous requests
+
+    Returns:
+        One entry per page URL, in order: the URL info dict, or the
+        exception raised for that URL
+    """
+    site_url = normalize_site_url(site_url)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(page_url: str) -> dict:
+        async with sem:
+            return await get_url_info(site_url, page_url)
+
+    return await asyncio.gather(
+        *(_one(u) for u in page_urls), return_exceptions=True
+    )
 
 
 async def get_page_stats(site_url: str) -> list[dict]:
     """
     Get top page statistics for a site in Bing.
 
+    Results are cached for REPORT_CACHE_TTL seconds.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
 
     Returns:
         List of page stat dicts with keys: Url, Impressions, Clicks, AvgClickPosition
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetPageStats",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, f"get_page_stats for {site_url}")
-    data = response.json()
-    return data.get("d", []) or []
+    site_url = normalize_site_url(site_url)
+    return await _cached_bing_get(
+        _report_cache,
+        _URL_GET_PAGE_STATS,
+        {"siteUrl": site_url},
+        f"get_page_stats for {site_url}",
+        [],
+    )
 
 
 async def submit_url(site_url: str, url: str) -> dict:
     """
     Submit a single URL for indexing in Bing.
 
+    Concurrent calls for the same site are coalesced into one SubmitUrlBatch
+    request (see _UrlSubmissionBatcher); a lone call still uses SubmitUrl.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
         url: The page URL to submit for indexing
@@ -288,21 +578,20 @@ async def submit_url(site_url: str, url: str) -> dict:
     Returns:
         Response dict (empty on success)
     """
-    api_key = get_bing_api_key()
+    return await _submission_batcher.submit(normalize_site_url(site_url), url)
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.post(
-            f"{BING_API_BASE}/SubmitUrl",
-            params={"apikey": api_key},
-            json={"siteUrl": site_url, "url": url},
-            headers={"User-Agent": USER_AGENT, "Content-Type": "application/json"},
-        )
 
-    _handle_response_error(response, f"submit_url for {url}")
-    try:
-        return response.json()
-    except Exception:
-        return {"status": "submitted"}
+async def _submit_url_now(site_url: str, url: str) -> dict:
+    """Send one SubmitUrl request immediately (no batching)."""
+    result = await _bing_post(
+        _URL_SUBMIT_URL,
+        {"siteUrl": site_url, "url": url},
+        f"submit_url for {url}",
+        {"status": "submitted"},
+    )
+    _quota_cache.invalidate(site_url)
+    _url_info_cache.invalidate()
+    return result
 
 
 async def submit_url_batch(site_url: str, urls: list[str]) -> dict:
@@ -316,100 +605,174 @@ async def submit_url_batch(site_url: str, urls: list[str]) -> dict:
     Returns:
         Response dict (empty on success)
     """
-    api_key = get_bing_api_key()
+    site_url = normalize_site_url(site_url)
+    result = await _bing_post(
+        _URL_SUBMIT_URL_BATCH,
+        {"siteUrl": site_url, "urlList": urls},
+        f"submit_url_batch for {site_url}",
+        {"status": "submitted", "count": len(urls)},
+    )
+    _quota_cache.invalidate(site_url)
+    _url_info_cache.invalidate()
+    return result
+
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.post(
-            f"{BING_API_BASE}/SubmitUrlBatch",
-            params={"apikey": api_key},
-            json={"siteUrl": site_url, "urlList": urls},
-            headers={"User-Agent": USER_AGENT, "Content-Type": "application/json"},
+class _UrlSubmissionBatcher:
+    """
+    Coalesces concurrent submit_url() calls into SubmitUrlBatch requests.
+
+    URLs for a site are collected for up to `flush_interval` seconds (or
+    until `max_batch` are pending) and sent in one POST. If a merged batch
+    is rejected, its URLs are resubmitted one by one, so a bad URL only
+    fails its own caller. Sequential awaits still cost one request each —
+    only calls in flight together are merged.
+    """
+
+    def __init__(self, flush_interval: float, max_batch: int):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.Task] = {}
+        self._flushing: set[asyncio.Task] = set()
+
+    async def submit(self, site_url: str, url: str) -> dict:
+        """Queue `url` for `site_url` and wait for its batch to be sent."""
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(site_url, [])
+        batch.append((url, future))
+
+        if len(batch) >= self.max_batch:
+            timer = self._timers.pop(site_url, None)
+            if timer is not None:
+                timer.cancel()
+            self._start_flush(site_url)
+        elif site_url not in self._timers:
+            self._timers[site_url] = asyncio.create_task(self._flush_later(site_url))
+
+        return await future
+
+    def _start_flush(self, site_url: str) -> None:
+        # Keep a reference so the flush task isn't garbage-collected mid-send
+        task = asyncio.create_task(self._flush(site_url))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _flush_later(self, site_url: str) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._timers.pop(site_url, None)
+        self._start_flush(site_url)
+
+    async def _flush(self, site_url: str) -> None:
+        batch = self._pending.pop(site_url, [])
+        if not batch:
+            return
+        urls = list(dict.fromkeys(url for url, _ in batch))
+
+        try:
+            results = await self._send(site_url, urls)
+        except BaseException:
+            # Cancelled (e.g. at shutdown): don't leave callers waiting forever
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for url, future in batch:
+            if future.done():
+                continue
+            result = results[url]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send(self, site_url: str, urls: list[str]) -> dict:
+        """Submit `urls`; map each URL to its response or exception."""
+        if len(urls) > 1:
+            try:
+                return dict.fromkeys(urls, await submit_url_batch(site_url, urls))
+            except Exception as e:
+                # One request per URL, as many as the callers would have sent
+                # without batching
+                logger.debug(
+                    f"SubmitUrlBatch of {len(urls)} URLs failed ({e}); "
+                    "submitting them one by one"
+                )
+        results = await asyncio.gather(
+            *(_submit_url_now(site_url, url) for url in urls),
+            return_exceptions=True,
         )
+        return dict(zip(urls, results))
 
-    _handle_response_error(response, f"submit_url_batch for {site_url}")
-    try:
-        return response.json()
-    except Exception:
-        return {"status": "submitted", "count": len(urls)}
+
+_submission_batcher = _UrlSubmissionBatcher(SUBMIT_FLUSH_INTERVAL, SUBMIT_BATCH_MAX)
 
 
 async def get_crawl_issues(site_url: str) -> list[dict]:
     """
     Get crawl issues for a site in Bing.
 
+    Results are cached for REPORT_CACHE_TTL seconds.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
 
     Returns:
         List of crawl issue dicts
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetCrawlIssues",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, f"get_crawl_issues for {site_url}")
-    data = response.json()
-    return data.get("d", []) or []
+    site_url = normalize_site_url(site_url)
+    return await _cached_bing_get(
+        _report_cache,
+        _URL_GET_CRAWL_ISSUES,
+        {"siteUrl": site_url},
+        f"get_crawl_issues for {site_url}",
+        [],
+    )
 
 
 async def get_url_submission_quota(site_url: str) -> dict:
     """
     Get the daily URL submission quota for a site in Bing.
 
+    Results are cached per site for SITE_STATS_CACHE_TTL seconds, then
+    served for up to QUOTA_STALE_TTL more while being refreshed in the
+    background. Submitting URLs for the site invalidates the entry.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
 
     Returns:
         Dict with DailyQuota and MonthlyQuota
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetUrlSubmissionQuota",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, f"get_url_submission_quota for {site_url}")
-    data = response.json()
-    return data.get("d") or {}
+    site_url = normalize_site_url(site_url)
+    return await _quota_cache.get_or_fetch(
+        site_url,
+        lambda: _bing_get(
+            _URL_GET_URL_SUBMISSION_QUOTA,
+            {"siteUrl": site_url},
+            f"get_url_submission_quota for {site_url}",
+            {},
+        ),
+    )
 
 
 async def get_link_counts(site_url: str) -> list[dict]:
     """
     Get inbound link counts for a site in Bing.
 
+    Results are cached for REPORT_CACHE_TTL seconds, then served for up to
+    LINKS_STALE_TTL more while being refreshed in the background.
+
     Args:
         site_url: The site URL (e.g., "https://example.com/")
 
     Returns:
         List of link count data
     """
-    api_key = get_bing_api_key()
-
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        response = await client.get(
-            f"{BING_API_BASE}/GetLinkCounts",
-            params={
-                "apikey": api_key,
-                "siteUrl": site_url,
-                "getCountsPerPage": 0,
-            },
-            headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
-        )
-
-    _handle_response_error(response, f"get_link_counts for {site_url}")
-    data = response.json()
-    return data.get("d", []) or []
+    site_url = normalize_site_url(site_url)
+    return await _cached_bing_get(
+        _links_cache,
+        _URL_GET_LINK_COUNTS,
+        {"siteUrl": site_url, "getCountsPerPage": 0},
+        f"get_link_counts for {site_url}",
+        [],
+    )
@@ -17,15 +17,29 @@ RPC IDs discovered via Playwright interception of a live GSC session:
   mKtLlc  — property-level summary
 """
 
+import asyncio
+import bisect
+import hashlib
 import json
 import logging
+import os
 import re
+import sys
 import time
 import urllib.parse
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 import httpx
 
+from ._errors import raise_for_known_status
+from ._http import (
+    ConcurrencyLimiter, RateLimiter, new_async_client, request_with_retry,
+)
+from ._validate import is_settled_date, normalize_site_url, validate_date
+from .._cache import TTLCache, env_ttl
+from .._json import OFFLOAD_THRESHOLD, dumps, loads
 from ..extractors.chrome_cookies import get_google_cookies, get_all_cookies_header
 from ..extractors.sapisidhash import compute_sapisidhash, CHROME_USER_AGENT
 
@@ -36,9 +50,37 @@ logger = logging.getLogger(__name__)
 GSC_ORIGIN = "https://search.google.com"
 BE_URL = "https://search.google.com/_/SearchConsoleAggReportUi/data/batchexecute"
 APP_ID = "SearchConsoleAggReportUi"
+WELCOME_URL = f"{GSC_ORIGIN}/search-console/welcome"
+PERFORMANCE_URL = f"{GSC_ORIGIN}/search-console/performance/search-analytics"
 
 REQUEST_TIMEOUT = 30.0
 
+# Query parameters every batchexecute request carries; callers add "rpcids"
+_BASE_PARAMS = {
+    "source-path": "/search-console/performance/search-analytics",
+    "f.sid": "-1",
+    "bl": "boq_searchconsoleuiserver_20240101.00_p0",
+    "hl": "en",
+    "soc-app": "1",
+    "soc-platform": "1",
+    "soc-device": "1",
+    "_reqid": "1",
+    "rt": "c",
+}
+
+# Dummy f.req that deliberately has an unknown RPC to get a 400 with XSRF
+_XSRF_PROBE_BODY = "f.req=" + urllib.parse.quote(
+    dumps([[["__xsrf_probe__", "null", None, "1"]]])
+)
+
+# Client-side request rate ceiling (requests per second)
+RATE_LIMIT_PER_SECOND = 5
+
+# Requests in flight: starts at CONCURRENCY_INITIAL, adapts between 1 and
+# CONCURRENCY_MAX as the API accepts or throttles requests
+CONCURRENCY_INITIAL = 4
+CONCURRENCY_MAX = 16
+
 # ─── RPC IDs (discovered via Playwright interception) ──────────────────────────
 
 RPC_LIST_SITES    = "SM7Bqb"   # args: [[1, [[["site_url"], ...]]]] — sends known site list
@@ -68,88 +110,292 @@ DIMENSIONS = {
 # Additional values may correspond to different presets.
 DATE_PERIOD_DEFAULT = 27
 
+# ─── Compiled patterns ────────────────────────────────────────────────────────
+
+# XSRF token in the probe's 400 body, and the alternate "at=" form
+_XSRF_RE = re.compile(r'"xsrf","([^"]+)"')
+_AT_RE = re.compile(r'at=([A-Za-z0-9_\-]+:[0-9]+)')
+
+# Key of an AF_initDataCallback block embedded in GSC page HTML. Byte
+# patterns: the scrapers search resp.content directly, skipping a str
+# decode pass.
+_AF_KEY_RE = re.compile(rb"""key:\s*['"]([^'"]+)['"]""")
+
+# Quoted property URLs: "https://example.com/" or "sc-domain:example.com"
+_SITE_RE = re.compile(
+    rb'(?:"|\')((?:https?://[a-zA-Z0-9\-\.]+/)|(?:sc-domain:[a-zA-Z0-9\-\.]+))(?:"|\')'
+)
+
 # ─── XSRF token cache ─────────────────────────────────────────────────────────
 
 _xsrf_cache: dict = {"token": None, "expires": 0.0}
 _XSRF_TTL = 3600  # 1 hour
+_xsrf_lock = asyncio.Lock()
+
+# The probe response is streamed in chunks of this size until the token shows up
+_XSRF_STREAM_CHUNK = 4096
+_XSRF_SCAN_OVERLAP = 256
+
+# Persisted copy so a fresh process can skip the XSRF probe while the token
+# is still valid; tied to the SAPISID it was issued for
+XSRF_CACHE_FILE = Path.home() / ".cache" / "gsc-bing-mcp" / "xsrf.json"
+
+# ─── Site list cache ──────────────────────────────────────────────────────────
+
+# Keyed by session fingerprint, so switching Google accounts never serves
+# the previous account's properties. Override with GSC_SITES_TTL.
+SITES_CACHE_TTL = env_ttl("GSC_SITES_TTL", 300)  # verified properties change rarely
+_sites_cache = TTLCache(SITES_CACHE_TTL, maxsize=4)
+
+# ─── Scraped page cache ───────────────────────────────────────────────────────
+
+# Parsed results of the HTML scrapers, keyed by (page URL, session fingerprint).
+# Pages that yielded nothing are remembered briefly too, so retries don't
+# re-download a large page only to find it empty again.
+HTML_CACHE_TTL = 120
+EMPTY_HTML_CACHE_TTL = 60
+_html_cache = TTLCache(HTML_CACHE_TTL, maxsize=32)
+
+# ─── RPC response cache ───────────────────────────────────────────────────────
+
+# Parsed query_search_analytics / get_sitemaps results, keyed by the call's
+# arguments plus the session fingerprint. Ranges that end on a settled day
+# (see is_settled_date) no longer change and are kept much longer; GSC only
+# refreshes recent days every few hours, so the rest can safely live for
+# minutes. Override the short lifetime with GSC_SA_CACHE_TTL.
+RPC_CACHE_TTL = env_ttl("GSC_SA_CACHE_TTL", 900)
+SETTLED_RPC_CACHE_TTL = 24 * 3600
+_rpc_cache = TTLCache(RPC_CACHE_TTL, maxsize=256)
+
+# ─── Shared HTTP client ───────────────────────────────────────────────────────
+
+_client: Optional[httpx.AsyncClient] = None
+_rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND)
+_concurrency = ConcurrencyLimiter(CONCURRENCY_INITIAL, CONCURRENCY_MAX)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = new_async_client(REQUEST_TIMEOUT)
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared AsyncClient (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 # ─── Core batchexecute helpers ────────────────────────────────────────────────
 
-def _build_headers(cookies: dict[str, str]) -> dict[str, str]:
-    """Build the HTTP headers required for batchexecute POST requests."""
-    sapisid = (
+# Headers that never change between requests; only Authorization and Cookie
+# are computed per call
+_STATIC_HEADERS = {
+    "Origin": GSC_ORIGIN,
+    "Referer": PERFORMANCE_URL,
+    "X-Origin": GSC_ORIGIN,
+    "X-Same-Domain": "1",
+    "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+    "User-Agent": CHROME_USER_AGENT,
+    "Accept": "*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "X-Goog-Authuser": "0",
+}
+
+
+def _get_sapisid(cookies: dict[str, str]) -> str:
+    """Return the SAPISID cookie (or its __Secure- variants), or ""."""
+    return (
         cookies.get("SAPISID")
         or cookies.get("__Secure-3PAPISID")
         or cookies.get("__Secure-1PAPISID")
         or ""
     )
-    auth = compute_sapisidhash(sapisid, GSC_ORIGIN)
-    cookie_str = get_all_cookies_header(cookies)
 
+
+# SAPISIDHASH + Cookie headers are reused for this many seconds per cookie set
+_HEADERS_REUSE_SECONDS = 5
+
+
+def _build_headers(cookies: dict[str, str]) -> dict[str, str]:
+    """
+    Build the HTTP headers required for batchexecute POST requests.
+
+    The result is shared between calls with the same cookies inside one
+    _HEADERS_REUSE_SECONDS window — treat it as read-only.
+    """
+    bucket = int(time.time()) // _HEADERS_REUSE_SECONDS
+    # get_all_cookies_header gets the cookie dict itself, so the header string
+    # prebuilt for the cached cookie set is reused instead of joined again
+    return _headers_cached(_get_sapisid(cookies), get_all_cookies_header(cookies), bucket)
+
+
+@lru_cache(maxsize=8)
+def _headers_cached(sapisid: str, cookie_str: str, bucket: int) -> dict[str, str]:
+    """Compute headers for a cookie set; `bucket` only expires the cache entry."""
     return {
-        "Authorization": auth,
+        "Authorization": compute_sapisidhash(sapisid, GSC_ORIGIN),
         "Cookie": cookie_str,
-        "Origin": GSC_ORIGIN,
-        "Referer": f"{GSC_ORIGIN}/search-console/performance/search-analytics",
-        "X-Origin": GSC_ORIGIN,
-        "X-Same-Domain": "1",
-        "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-        "User-Agent": CHROME_USER_AGENT,
-        "Accept": "*/*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "X-Goog-Authuser": "0",
+        **_STATIC_HEADERS,
     }
 
 
-def _get_xsrf_token(cookies: dict[str, str]) -> str:
+@lru_cache(maxsize=256)
+def _form_quote(value: str) -> str:
+    """
+    Percent-encode a form value (memoized).
+
+    The same envelopes recur across tool calls (one property, a handful of
+    RPCs) and the XSRF token is constant for an hour, so most calls are a
+    cache hit instead of another per-character quoting pass.
+    """
+    return urllib.parse.quote_from_bytes(value.encode(), safe="")
+
+
+@lru_cache(maxsize=128)
+def _encode_site(site_url: str) -> str:
+    """Percent-encode a property URL for use as a query value (memoized)."""
+    return urllib.parse.quote(site_url, safe="")
+
+
+async def _get_xsrf_token(cookies: dict[str, str]) -> str:
     """
     Obtain the XSRF token required for batchexecute requests.
 
     Strategy: make a dummy request that returns a 400 error containing the XSRF
     token in the response body as '"xsrf","TOKEN"'.
+
+    The probe goes over the shared pooled client, and concurrent callers on a
+    cold cache wait for a single probe instead of each sending their own.
     """
     if _xsrf_cache["token"] and time.time() < _xsrf_cache["expires"]:
         return _xsrf_cache["token"]
 
+    async with _xsrf_lock:
+        # Another caller may have fetched it while we waited
+        if _xsrf_cache["token"] and time.time() < _xsrf_cache["expires"]:
+            return _xsrf_cache["token"]
+        token = _load_persisted_xsrf(cookies)
+        if token:
+            return token
+        return await _fetch_xsrf_token(cookies)
+
+
+def _sapisid_fingerprint(cookies: dict[str, str]) -> str:
+    """Short hash identifying the session a token belongs to (never the raw cookie)."""
+    return hashlib.sha256(_get_sapisid(cookies).encode()).hexdigest()[:16]
+
+
+def _store_xsrf(token: str, cookies: dict[str, str]) -> None:
+    """Cache a fresh XSRF token in memory and on disk."""
+    expires = time.time() + _XSRF_TTL
+    _xsrf_cache["token"] = token
+    _xsrf_cache["expires"] = expires
+
+    payload = dumps({
+        "token": token,
+        "expires": expires,
+        "sapisid_fp": _sapisid_fingerprint(cookies),
+    })
+    try:
+        XSRF_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = XSRF_CACHE_FILE.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp, XSRF_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not persist XSRF token: {e}")
+
+
+def _load_persisted_xsrf(cookies: dict[str, str]) -> Optional[str]:
+    """Return the on-disk XSRF token if unexpired and issued for this session."""
+    try:
+        saved = loads(XSRF_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(saved, dict):
+        return None
+
+    token = saved.get("token")
+    expires = saved.get("expires", 0.0)
+    if (
+        not token
+        or time.time() >= expires
+        or saved.get("sapisid_fp") != _sapisid_fingerprint(cookies)
+    ):
+        return None
+
+    _xsrf_cache["token"] = token
+    _xsrf_cache["expires"] = expires
+    logger.debug("Using persisted XSRF token")
+    return token
+
+
+def clear_xsrf_token() -> None:
+    """Forget the cached XSRF token, in memory and on disk."""
+    _xsrf_cache["token"] = None
+    _xsrf_cache["expires"] = 0.0
+    try:
+        XSRF_CACHE_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove persisted XSRF token: {e}")
+
+
+def clear_caches() -> None:
+    """Drop every cached GSC response (site lists, scraped pages, RPC results)."""
+    _sites_cache.invalidate()
+    _html_cache.invalidate()
+    _rpc_cache.invalidate()
+    logger.debug("GSC response caches cleared")
+
+
+async def _fetch_xsrf_token(cookies: dict[str, str]) -> str:
+    """
+    Send the XSRF probe request and cache the token it returns.
+
+    The body is streamed and scanned as it arrives; the token sits near the
+    start of the error response, so the rest is never read.
+    """
     headers = _build_headers(cookies)
-    # Dummy f.req that deliberately has an unknown RPC to get a 400 with XSRF
-    dummy_freq = json.dumps([[["__xsrf_probe__", "null", None, "1"]]])
-    body = f"f.req={urllib.parse.quote(dummy_freq)}"
-
-    params = {
-        "rpcids": "__xsrf_probe__",
-        "source-path": "/search-console/performance/search-analytics",
-        "f.sid": "-1",
-        "bl": "boq_searchconsoleuiserver_20240101.00_p0",
-        "hl": "en",
-        "soc-app": "1",
-        "soc-platform": "1",
-        "soc-device": "1",
-        "_reqid": "1",
-        "rt": "c",
-    }
+    body = _XSRF_PROBE_BODY
+
+    params = {**_BASE_PARAMS, "rpcids": "__xsrf_probe__"}
 
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT) as client:
-            resp = client.post(BE_URL, headers=headers, content=body, params=params)
+        await _rate_limiter.acquire()
+        resp_text = ""
+        match = None
+        async with _get_client().stream(
+            "POST", BE_URL, headers=headers, content=body, params=params,
+        ) as resp:
+            async for chunk in resp.aiter_text(_XSRF_STREAM_CHUNK):
+                # Re-scan a little before the new text so a token split
+                # across chunks is still found
+                scan_from = max(0, len(resp_text) - _XSRF_SCAN_OVERLAP)
+                resp_text += chunk
+                # Look for '"xsrf","TOKEN"' in the 400 response body
+                match = _XSRF_RE.search(resp_text, scan_from)
+                if match:
+                    break
 
-        resp_text = resp.text
-        # Look for '"xsrf","TOKEN"' in the 400 response body
-        match = re.search(r'"xsrf","([^"]+)"', resp_text)
         if match:
             token = match.group(1)
-            _xsrf_cache["token"] = token
-            _xsrf_cache["expires"] = time.time() + _XSRF_TTL
+            _store_xsrf(token, cookies)
             logger.debug(f"Got XSRF token: {token[:20]}...")
             return token
         else:
             # Sometimes the token appears in other formats
-            match2 = re.search(r'at=([A-Za-z0-9_\-]+:[0-9]+)', resp_text)
+            match2 = _AT_RE.search(resp_text)
             if match2:
                 token = match2.group(1)
-                _xsrf_cache["token"] = token
-                _xsrf_cache["expires"] = time.time() + _XSRF_TTL
+                _store_xsrf(token, cookies)
                 return token
             logger.warning(f"XSRF token not found in response (status {resp.status_code})")
             raise RuntimeError(
@@ -160,7 +406,78 @@ def _get_xsrf_token(cookies: dict[str, str]) -> str:
         raise RuntimeError(f"Network error getting XSRF token: {e}") from e
 
 
-def _parse_batchexecute_response(text: str) -> list[dict]:
+_XSSI_PREFIX = b")]}'"
+_WHITESPACE = b" \t\r\n"
+_json_decoder = json.JSONDecoder()
+
+
+def _iter_batchexecute_chunks(body: bytes):
+    """
+    Yield each decoded JSON chunk of a batchexecute body.
+
+    Works on the raw response bytes (no str decode pass) and walks the
+    length prefixes instead of regex-splitting the body: each chunk is
+    sliced out by its declared size and decoded directly. If a slice
+    doesn't decode (the count is off), the chunk is decoded in place with
+    raw_decode, which finds its end without trusting the count. A body
+    without length lines is decoded as a single chunk.
+    """
+    body = body.strip()
+    if body.startswith(_XSSI_PREFIX):
+        body = body[len(_XSSI_PREFIX):]
+
+    pos, size = 0, len(body)
+    while pos < size:
+        # Skip blank lines between chunks
+        while pos < size and body[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= size:
+            return
+
+        nl = body.find(b"\n", pos)
+        header = body[pos:nl if nl != -1 else size].strip()
+        if not header.isdigit():
+            # Unframed body — treat the rest as one JSON document
+            try:
+                yield loads(body[pos:])
+            except json.JSONDecodeError:
+                pass
+            return
+
+        start = nl + 1
+        end = start + int(header)
+        try:
+            yield loads(body[start:end])
+            pos = end
+            continue
+        except json.JSONDecodeError:
+            pass
+
+        # raw_decode needs str; surrogateescape keeps the byte offsets exact
+        rest = body[start:].decode("utf-8", "surrogateescape")
+        skip = len(rest) - len(rest.lstrip())
+        try:
+            chunk, end_char = _json_decoder.raw_decode(rest, skip)
+        except json.JSONDecodeError:
+            return  # truncated / garbage tail
+        pos = start + len(rest[:end_char].encode("utf-8", "surrogateescape"))
+        yield chunk
+
+
+def _decode_wrb_payload(raw_data):
+    """Decode a wrb.fr payload (a JSON string, or null); non-JSON is returned as-is."""
+    if isinstance(raw_data, str):
+        try:
+            return loads(raw_data)
+        except json.JSONDecodeError:
+            return raw_data
+    return raw_data
+
+
+def _parse_batchexecute_response(
+    body: bytes | str,
+    want: Optional[set[str]] = None,
+) -> list[dict]:
     """
     Parse the batchexecute streaming response.
 
@@ -174,26 +491,18 @@ def _parse_batchexecute_response(text: str) -> list[dict]:
     Each JSON array item follows the "wrb.fr" envelope:
       ["wrb.fr", "RPC_ID", "data_json_string", null, null, null, "seq"]
 
+    If `want` is given, only those RPCs' payloads are decoded (others keep
+    their raw JSON string) and parsing stops once every wanted RPC is seen.
+
     Returns list of {"rpc_id": str, "data": parsed_data} dicts.
     """
-    # Strip anti-XSSI prefix
-    text = re.sub(r"^\)\]\}'\n?", "", text.strip())
-
     results = []
+    missing = set(want) if want is not None else None
 
-    # Split on chunk-size lines (lines that are only digits, optionally with whitespace)
-    chunks = re.split(r"(?m)^\d+\s*$", text)
-
-    for chunk in chunks:
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-
-        try:
-            outer = json.loads(chunk)
-        except json.JSONDecodeError:
-            continue  # skip non-JSON chunks (e.g. trailing newlines)
+    if isinstance(body, str):
+        body = body.encode()
 
+    for outer in _iter_batchexecute_chunks(body):
         if not isinstance(outer, list):
             continue
 
@@ -207,18 +516,75 @@ def _parse_batchexecute_response(text: str) -> list[dict]:
                 rpc_id = item[1]
                 raw_data = item[2]  # JSON string or null
 
-                if raw_data is None:
-                    data = None
-                elif isinstance(raw_data, str):
-                    try:
-                        data = json.loads(raw_data)
-                    except json.JSONDecodeError:
-                        data = raw_data
-                else:
-                    data = raw_data
+                if want is not None and rpc_id not in want:
+                    results.append({"rpc_id": rpc_id, "data": raw_data})
+                    continue
 
-                results.append({"rpc_id": rpc_id, "data": data})
+                results.append({"rpc_id": rpc_id, "data": _decode_wrb_payload(raw_data)})
+                if missing is not None:
+                    missing.discard(rpc_id)
+                    if not missing:
+                        return results
+
+    return results
+
+
+async def _post_batchexecute(
+    calls: list[tuple[str, list]],
+    cookies: dict[str, str],
+) -> list[dict]:
+    """
+    POST one batchexecute envelope carrying every (rpc_id, args) in `calls`.
+
+    Returns:
+        Parsed wrb.fr results (see _parse_batchexecute_response)
+
+    Raises:
+        RuntimeError: On auth failure, rate limit, or empty response
+    """
+    headers = _build_headers(cookies)
+    xsrf = await _get_xsrf_token(cookies)
+
+    # [[[rpc_id, "<args as JSON string>", null, "seq"], ...]] — assembled by
+    # hand; RPC IDs are plain alphanumerics, only args need escaping
+    f_req = "[[" + ",".join(
+        f'["{rpc_id}",{dumps(dumps(args))},null,"{i}"]'
+        for i, (rpc_id, args) in enumerate(calls, start=1)
+    ) + "]]"
+    body = f"f.req={_form_quote(f_req)}&at={_form_quote(xsrf)}"
+    rpc_ids = ",".join(rpc_id for rpc_id, _ in calls)
+
+    params = {**_BASE_PARAMS, "rpcids": rpc_ids}
+
+    resp = await request_with_retry(
+        _get_client(), "POST", BE_URL,
+        limiter=_rate_limiter, concurrency=_concurrency,
+        headers=headers, content=body, params=params,
+    )
+
+    if resp.status_code in (401, 403):
+        # The token may belong to a dead session — don't reuse it
+        clear_xsrf_token()
+    raise_for_known_status(resp, "gsc")
+
+    if resp.status_code not in (200, 400):
+        raise RuntimeError(
+            f"Unexpected HTTP {resp.status_code} from batchexecute. "
+            f"Body preview: {resp.text[:300]}"
+        )
 
+    body = resp.content
+    want = {rpc_id for rpc_id, _ in calls}
+    if len(body) < OFFLOAD_THRESHOLD:
+        results = _parse_batchexecute_response(body, want)
+    else:
+        # Large envelopes (big breakdowns) are parsed in a worker thread
+        results = await asyncio.to_thread(_parse_batchexecute_response, body, want)
+    if not results:
+        raise RuntimeError(
+            f"Empty response from batchexecute ({rpc_ids}). "
+            f"Body preview: {resp.text[:300]}"
+        )
     return results
 
 
@@ -244,65 +610,101 @@ async def _batchexecute(
     if cookies is None:
         cookies = get_google_cookies()
 
-    headers = _build_headers(cookies)
-    xsrf = _get_xsrf_token(cookies)
-
-    args_json = json.dumps(args)
-    f_req = json.dumps([[[ rpc_id, args_json, None, "1"]]])
-    body = f"f.req={urllib.parse.quote(f_req)}&at={urllib.parse.quote(xsrf)}"
-
-    params = {
-        "rpcids": rpc_id,
-        "source-path": "/search-console/performance/search-analytics",
-        "f.sid": "-1",
-        "bl": "boq_searchconsoleuiserver_20240101.00_p0",
-        "hl": "en",
-        "soc-app": "1",
-        "soc-platform": "1",
-        "soc-device": "1",
-        "_reqid": "1",
-        "rt": "c",
-    }
+    results = await _post_batchexecute([(rpc_id, args)], cookies)
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-        resp = await client.post(BE_URL, headers=headers, content=body, params=params)
+    # Return the first matching result
+    for r in results:
+        if r["rpc_id"] == rpc_id:
+            return r["data"]
+    # Fallback: return the first result (not in `want`, so still undecoded)
+    return _decode_wrb_payload(results[0]["data"])
 
-    if resp.status_code == 401:
-        raise RuntimeError(
-            "Google session expired. Please re-open Chrome and log in to Google, "
-            "then try again. The MCP server will pick up fresh cookies automatically."
-        )
-    if resp.status_code == 403:
-        raise RuntimeError(
-            "Access denied by Google (403). Your session cookies may be stale. "
-            "Re-open Chrome, visit search.google.com/search-console, and try again."
-        )
-    if resp.status_code == 429:
-        raise RuntimeError("Rate limited by Google. Please wait a moment and try again.")
 
-    if resp.status_code not in (200, 400):
-        raise RuntimeError(
-            f"Unexpected HTTP {resp.status_code} from batchexecute. "
-            f"Body preview: {resp.text[:300]}"
-        )
+async def _batchexecute_many(
+    calls: list[tuple[str, list]],
+    cookies: Optional[dict[str, str]] = None,
+) -> dict:
+    """
+    Execute several batchexecute RPCs in one HTTP round trip.
 
-    results = _parse_batchexecute_response(resp.text)
-    if not results:
-        raise RuntimeError(
-            f"Empty response from batchexecute ({rpc_id}). "
-            f"Body preview: {resp.text[:300]}"
-        )
+    Args:
+        calls: (rpc_id, args) pairs; each rpc_id should appear only once
+        cookies: Pre-fetched Google cookies dict
 
-    # Return the first matching result
+    Returns:
+        Dict of rpc_id → parsed data. RPCs GSC returned nothing for are absent.
+
+    Raises:
+        RuntimeError: On auth failure, rate limit, or parse error
+    """
+    if cookies is None:
+        cookies = get_google_cookies()
+
+    results = await _post_batchexecute(calls, cookies)
+
+    wanted = {rpc_id for rpc_id, _ in calls}
+    data: dict = {}
     for r in results:
-        if r["rpc_id"] == rpc_id:
-            return r["data"]
-    # Fallback: return the first result
-    return results[0]["data"]
+        if r["rpc_id"] in wanted:
+            data.setdefault(r["rpc_id"], r["data"])
+    return data
 
 
 # ─── Public API ───────────────────────────────────────────────────────────────
 
+_AF_CALLBACK = b"AF_initDataCallback("
+_AF_DATA = b"data:"
+# Where a block's data value ends: right before ", sideChannel" on the
+# performance page; the welcome-page scan only takes blocks closing at "});"
+_AF_END_SIDECHANNEL = (b"sideChannel",)
+_AF_END_CLOSE = (b"});",)
+# Give up on a block after this many candidate ends fail to decode
+_AF_MAX_END_TRIES = 8
+
+
+def _iter_af_init_data(html: bytes, ends: tuple[bytes, ...]):
+    """
+    Yield (key, data) for each AF_initDataCallback block in a GSC page.
+
+    Scans with bytes.find instead of a backtracking regex: from each
+    callback, jump to "data:", then try the next few occurrences of the
+    `ends` markers until the slice decodes — the first one does unless a
+    string inside the data happens to contain the marker. Blocks whose
+    data can't be decoded are skipped.
+    """
+    pos = 0
+    while True:
+        start = html.find(_AF_CALLBACK, pos)
+        if start == -1:
+            return
+        next_block = html.find(_AF_CALLBACK, start + len(_AF_CALLBACK))
+        limit = next_block if next_block != -1 else len(html)
+        pos = limit
+
+        data_at = html.find(_AF_DATA, start, limit)
+        if data_at == -1:
+            continue
+        key_match = _AF_KEY_RE.search(html, start, data_at)
+        key = key_match.group(1).decode("utf-8", "replace") if key_match else "?"
+        data_start = data_at + len(_AF_DATA)
+
+        search_from = data_start
+        for _ in range(_AF_MAX_END_TRIES):
+            found = [e for e in (html.find(m, search_from, limit) for m in ends) if e != -1]
+            if not found:
+                break
+            end = min(found)
+            try:
+                data = loads(html[data_start:end].rstrip().rstrip(b",").rstrip())
+            except json.JSONDecodeError:
+                search_from = end + 1
+                continue
+            yield key, data
+            break
+        else:
+            logger.debug(f"No decodable data in AF_initDataCallback block {key}")
+
+
 async def _scrape_sites_from_html(cookies: dict[str, str]) -> list[dict]:
     """
     Scrape the GSC welcome page to extract the list of verified properties.
@@ -313,39 +715,36 @@ async def _scrape_sites_from_html(cookies: dict[str, str]) -> list[dict]:
     Returns:
         List of dicts: [{"siteUrl": str, "permissionLevel": str}, ...]
     """
+    cache_key = (WELCOME_URL, _sapisid_fingerprint(cookies))
+    cached = _html_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     headers = _build_headers(cookies)
     
     # The welcome page contains the full property list
-    url = "https://search.google.com/search-console/welcome"
-    
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, follow_redirects=True) as client:
-        resp = await client.get(url, headers=headers)
+    resp = await request_with_retry(
+        _get_client(), "GET", WELCOME_URL,
+        limiter=_rate_limiter, concurrency=_concurrency,
+        headers=headers, follow_redirects=True,
+    )
     
     if resp.status_code != 200:
         raise RuntimeError(f"Failed to fetch GSC welcome page: HTTP {resp.status_code}")
     
-    html = resp.text
+    html = resp.content
     logger.debug(f"Fetched GSC welcome page ({len(html)} bytes)")
     
     sites = []
     
     # Strategy 1: Look for WIZ_global_data which contains GSC property data
-    wiz_pattern = re.compile(r'AF_initDataCallback\(\{[^}]*key:\s*[\'"]([^\'"]+)[\'"][^}]*data:([^\n]+)\}\);', re.MULTILINE)
-    wiz_matches = wiz_pattern.findall(html)
-    
-    for key, data_str in wiz_matches:
-        try:
-            data_str = data_str.rstrip().rstrip(',').rstrip()
-            data = json.loads(data_str)
-            _extract_sites_from_data(data, sites)
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.debug(f"Failed to parse AF_initDataCallback data for key {key}: {e}")
-            continue
+    for _key, data in _iter_af_init_data(html, _AF_END_CLOSE):
+        _extract_sites_from_data(data, sites)
     
     # Strategy 2: Look for site URLs in the HTML
     # Pattern: "https://example.com/" or "sc-domain:example.com"
-    site_pattern = re.compile(r'(?:"|\')((?:https?://[a-zA-Z0-9\-\.]+/)|(?:sc-domain:[a-zA-Z0-9\-\.]+))(?:"|\')')
-    matches = site_pattern.findall(html)
+    # (the pattern is ASCII-only, so matches decode losslessly)
+    matches = [m.decode("ascii") for m in _SITE_RE.findall(html)]
     
     # Common Google/third-party domains to exclude (not user properties)
     exclude_domains = {
@@ -377,6 +776,7 @@ async def _scrape_sites_from_html(cookies: dict[str, str]) -> list[dict]:
             unique_sites.append(site)
     
     logger.debug(f"Extracted {len(unique_sites)} unique properties from HTML")
+    _html_cache.set(cache_key, unique_sites, None if unique_sites else EMPTY_HTML_CACHE_TTL)
     return unique_sites
 
 
@@ -390,12 +790,22 @@ async def list_sites(cookies: Optional[dict[str, str]] = None) -> list[dict]:
       3. Try oGVhvf with [""] — similar init RPC
       4. Try SM7Bqb with [[1, []]] — returns known sites (empty if cold session)
 
+    A successful result is cached per session for SITES_CACHE_TTL seconds;
+    concurrent calls share one lookup.
+
     Returns:
         List of dicts: [{"siteUrl": str, "permissionLevel": str}, ...]
     """
     if cookies is None:
         cookies = get_google_cookies()
 
+    return await _sites_cache.get_or_fetch(
+        _sapisid_fingerprint(cookies), lambda: _list_sites(cookies)
+    )
+
+
+async def _list_sites(cookies: dict[str, str]) -> list[dict]:
+    """Uncached list_sites(): try each strategy in turn."""
     # Strategy 1: Scrape the GSC overview page HTML
     try:
         sites = await _scrape_sites_from_html(cookies)
@@ -405,27 +815,47 @@ async def list_sites(cookies: Optional[dict[str, str]] = None) -> list[dict]:
     except Exception as e:
         logger.debug(f"HTML scraping failed: {e}")
 
-    # Strategy 2-4: Try initialization RPCs that fire at GSC page load
+    # Strategy 2-4: Try initialization RPCs that fire at GSC page load —
+    # sent together in one envelope; checked in order of preference
     init_rpcs = [
         ("pPDvCb", [0, ""]),
         ("oGVhvf", [""]),
         (RPC_LIST_SITES, [[1, []]]),
     ]
 
-    for rpc_id, args in init_rpcs:
-        try:
-            data = await _batchexecute(rpc_id, args, cookies)
-            if data is None or data == [] or data == "":
-                logger.debug(f"  {rpc_id}: returned empty")
-                continue
-            sites = []
-            _extract_sites_from_data(data, sites)
-            if sites:
-                logger.debug(f"  {rpc_id}: found {len(sites)} sites")
-                return sites
-            logger.debug(f"  {rpc_id}: data={str(data)[:200]}, no sites extracted")
-        except Exception as e:
-            logger.debug(f"  {rpc_id} failed: {e}")
+    try:
+        batched = await _batchexecute_many(init_rpcs, cookies)
+    except Exception as e:
+        logger.debug(f"  batched init RPCs failed: {e}")
+        batched = {}
+
+    # Anything the envelope didn't answer is retried on its own — all
+    # concurrently, so a cold session costs one extra round trip, not three
+    retry = [(rpc_id, args) for rpc_id, args in init_rpcs if rpc_id not in batched]
+    if retry:
+        retried = await asyncio.gather(
+            *(_batchexecute(rpc_id, args, cookies) for rpc_id, args in retry),
+            return_exceptions=True,
+        )
+        for (rpc_id, _), data in zip(retry, retried):
+            if isinstance(data, Exception):
+                logger.debug(f"  {rpc_id} failed: {data}")
+            else:
+                batched[rpc_id] = data
+
+    for rpc_id, _ in init_rpcs:
+        if rpc_id not in batched:
+            continue
+        data = batched[rpc_id]
+        if data is None or data == [] or data == "":
+            logger.debug(f"  {rpc_id}: returned empty")
+            continue
+        sites = []
+        _extract_sites_from_data(data, sites)
+        if sites:
+            logger.debug(f"  {rpc_id}: found {len(sites)} sites")
+            return sites
+        logger.debug(f"  {rpc_id}: data={str(data)[:200]}, no sites extracted")
 
     # Fallback: return error with instructions
     raise RuntimeError(
@@ -436,18 +866,25 @@ async def list_sites(cookies: Optional[dict[str, str]] = None) -> list[dict]:
 
 
 def _extract_sites_from_data(data, sites: list) -> None:
-    """Recursively scan response data for site URL strings."""
-    if isinstance(data, str):
-        # Check if it looks like a site URL
-        if data.startswith("http") or data.startswith("sc-domain:"):
-            if data not in [s.get("siteUrl") for s in sites]:
-                sites.append({"siteUrl": data, "permissionLevel": "siteOwner"})
-    elif isinstance(data, list):
-        for item in data:
-            _extract_sites_from_data(item, sites)
-    elif isinstance(data, dict):
-        for v in data.values():
-            _extract_sites_from_data(v, sites)
+    """
+    Scan response data for site URL strings, appending new ones to `sites`.
+
+    Walks the nested lists/dicts with an explicit stack (deep blobs can't hit
+    the recursion limit) in the same depth-first order as a recursive walk.
+    """
+    seen = {s.get("siteUrl") for s in sites}
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            # Check if it looks like a site URL
+            if node.startswith(("http", "sc-domain:")) and node not in seen:
+                seen.add(node)
+                sites.append({"siteUrl": node, "permissionLevel": "siteOwner"})
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            stack.extend(reversed(list(node.values())))
 
 
 async def get_site_summary(
@@ -463,6 +900,8 @@ async def get_site_summary(
     Returns:
         Raw summary data dict from GSC
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
@@ -470,6 +909,51 @@ async def get_site_summary(
     return {"siteUrl": site_url, "data": data}
 
 
+# Per-property RPCs multi_fetch() can combine, with the args each one takes
+_SITE_RPC_ARGS = {
+    RPC_SITE_SUMMARY: lambda site_url: [site_url],
+    RPC_COVERAGE:     lambda site_url: [site_url, 9],
+    RPC_STATS_PANEL:  lambda site_url: [site_url, [[7]]],
+    RPC_SITEMAPS:     lambda site_url: [site_url, 7],
+    RPC_INSIGHTS:     lambda site_url: [site_url],
+}
+
+
+async def multi_fetch(
+    site_url: str,
+    rpc_ids: Optional[list[str]] = None,
+    cookies: Optional[dict[str, str]] = None,
+) -> dict:
+    """
+    Fetch several per-property reports in a single batchexecute request.
+
+    Useful for dashboards that want summary, coverage, sitemaps and insights
+    together — one round trip instead of one per report.
+
+    Args:
+        site_url: Verified property URL
+        rpc_ids:  RPC IDs to fetch (default: every RPC in _SITE_RPC_ARGS)
+        cookies:  Pre-fetched Google cookies dict
+
+    Returns:
+        Dict with: site_url, raw (rpc_id → raw data, None if GSC sent nothing)
+    """
+    site_url = normalize_site_url(site_url)
+
+    if rpc_ids is None:
+        rpc_ids = list(_SITE_RPC_ARGS)
+    unknown = [r for r in rpc_ids if r not in _SITE_RPC_ARGS]
+    if unknown:
+        raise ValueError(
+            f"Unsupported RPC IDs: {unknown}. "
+            f"Valid options: {list(_SITE_RPC_ARGS)}"
+        )
+
+    calls = [(rpc_id, _SITE_RPC_ARGS[rpc_id](site_url)) for rpc_id in rpc_ids]
+    data = await _batchexecute_many(calls, cookies)
+    return {"site_url": site_url, "raw": {rpc_id: data.get(rpc_id) for rpc_id in rpc_ids}}
+
+
 def _date_to_timestamp_ms(date_str: str) -> int:
     """Convert YYYY-MM-DD to milliseconds since epoch (UTC midnight)."""
     import datetime
@@ -480,7 +964,19 @@ def _date_to_timestamp_ms(date_str: str) -> int:
 def _filter_rows_by_date(
     rows: list[dict], start_date: Optional[str], end_date: Optional[str],
 ) -> list[dict]:
-    """Filter time-series rows to only include dates within [start_date, end_date]."""
+    """
+    Filter time-series rows to only include dates within [start_date, end_date].
+
+    OLiH4d returns days in chronological order, so the range is found with
+    two binary searches and sliced; rows that arrive out of order are
+    filtered one by one instead.
+    """
+    dates = [row.get("date", "") for row in rows]
+    if dates == sorted(dates):
+        lo = bisect.bisect_left(dates, start_date) if start_date else 0
+        hi = bisect.bisect_right(dates, end_date) if end_date else len(rows)
+        return rows[lo:hi]
+
     filtered = []
     for row in rows:
         d = row.get("date", "")
@@ -519,6 +1015,7 @@ async def query_search_analytics(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     cookies: Optional[dict[str, str]] = None,
+    include_raw: bool = False,
 ) -> dict:
     """
     Query Search Analytics performance data from Google Search Console.
@@ -539,16 +1036,53 @@ async def query_search_analytics(
         start_date:  Optional start date in YYYY-MM-DD format
         end_date:    Optional end date in YYYY-MM-DD format
         cookies:     Pre-fetched Google cookies dict
+        include_raw: Also return the unparsed GSC response (large; off by default)
 
     Returns:
-        Dict with: site_url, dimensions, rows (list of dicts), row_count, raw
+        Dict with: site_url, dimensions, rows (list of dicts), row_count,
+        raw (None unless include_raw). Results are cached briefly (shared
+        between callers — treat as read-only).
     """
+    site_url = normalize_site_url(site_url)
+    if start_date:
+        validate_date(start_date)
+    if end_date:
+        validate_date(end_date)
+
     if cookies is None:
         cookies = get_google_cookies()
 
     if dimensions is None:
         dimensions = ["query"]
 
+    # Breakdowns always cover GSC's fixed ~3-month window (recent days
+    # included); only a date series filtered to a settled end date is final
+    settled = dimensions == ["date"] and is_settled_date(end_date)
+    key = (
+        RPC_PERF_TABLE, site_url, tuple(dimensions), date_period, search_type,
+        start_date, end_date, include_raw, _sapisid_fingerprint(cookies),
+    )
+    return await _rpc_cache.get_or_fetch(
+        key,
+        lambda: _query_search_analytics(
+            site_url, dimensions, date_period, search_type,
+            start_date, end_date, cookies, include_raw,
+        ),
+        SETTLED_RPC_CACHE_TTL if settled else None,
+    )
+
+
+async def _query_search_analytics(
+    site_url: str,
+    dimensions: list[str],
+    date_period: int,
+    search_type: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    cookies: dict[str, str],
+    include_raw: bool,
+) -> dict:
+    """query_search_analytics() minus input checks and caching."""
     dim_codes = []
     for d in dimensions:
         d_lower = d.lower()
@@ -615,7 +1149,7 @@ async def query_search_analytics(
         "search_type": search_type,
         "rows": rows,
         "row_count": len(rows),
-        "raw": raw,
+        "raw": raw if include_raw else None,
     }
 async def scrape_all_queries_from_html(
     site_url: str,
@@ -636,46 +1170,44 @@ async def scrape_all_queries_from_html(
     Returns:
         Dict with: site_url, search_type, rows (list of query dicts), row_count
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
     headers = _build_headers(cookies)
 
-    encoded_url = urllib.parse.quote(site_url, safe='')
+    encoded_url = _encode_site(site_url)
     url = (
-        f"https://search.google.com/search-console/performance/search-analytics"
+        f"{PERFORMANCE_URL}"
         f"?resource_id={encoded_url}"
         f"&metrics=CLICKS,IMPRESSIONS,CTR,POSITION"
         f"&breakdown=query"
     )
 
+    cache_key = (url, _sapisid_fingerprint(cookies))
+    cached = _html_cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "search_type": search_type}
+
     logger.debug(f"Fetching GSC performance page HTML: {url}")
 
-    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, follow_redirects=True) as client:
-        resp = await client.get(url, headers=headers)
+    resp = await request_with_retry(
+        _get_client(), "GET", url,
+        limiter=_rate_limiter, concurrency=_concurrency,
+        headers=headers, follow_redirects=True,
+    )
 
     if resp.status_code != 200:
         raise RuntimeError(f"Failed to fetch GSC performance page: HTTP {resp.status_code}")
 
-    html = resp.text
+    html = resp.content
     logger.debug(f"Fetched GSC performance page ({len(html)} bytes)")
 
-    import re
-
     queries = []
 
     # Find all AF_initDataCallback blocks and look for query data (dimension code [2])
-    all_blocks = re.findall(
-        r"AF_initDataCallback\(\{[^}]*key:\s*['\"]([^'\"]+)['\"][^}]*data:(.+?), sideChannel",
-        html, re.DOTALL,
-    )
-
-    for ds_key, data_str in all_blocks:
-        try:
-            data = json.loads(data_str)
-        except (json.JSONDecodeError, TypeError):
-            continue
-
+    for ds_key, data in _iter_af_init_data(html, _AF_END_SIDECHANNEL):
         if not isinstance(data, list) or len(data) < 2:
             continue
 
@@ -704,16 +1236,36 @@ async def scrape_all_queries_from_html(
 
     logger.debug(f"Extracted {len(queries)} queries from HTML")
 
-    return {
+    result = {
         "site_url": site_url,
         "search_type": search_type,
         "rows": queries,
         "row_count": len(queries),
         "source": "html_scraping",
     }
+    _html_cache.set(cache_key, result, None if queries else EMPTY_HTML_CACHE_TTL)
+    return result
 
 
 
+def _olih4d_metrics_slow(metrics: list) -> tuple:
+    """Per-field metric conversion for rows with missing or non-numeric values (0 if absent)."""
+    clicks = int(metrics[0]) if len(metrics) > 0 and isinstance(metrics[0], (int, float)) else 0
+    impressions = int(metrics[1]) if len(metrics) > 1 and isinstance(metrics[1], (int, float)) else 0
+    ctr_raw = metrics[2] if len(metrics) > 2 else 0
+    pos_raw = metrics[3] if len(metrics) > 3 else 0
+
+    try:
+        ctr = round(float(ctr_raw) * 100, 2) if isinstance(ctr_raw, (int, float)) else 0.0
+    except (ValueError, TypeError):
+        ctr = 0.0
+    try:
+        position = round(float(pos_raw), 1) if isinstance(pos_raw, (int, float)) else 0.0
+    except (ValueError, TypeError):
+        position = 0.0
+    return clicks, impressions, ctr, position
+
+
 def _parse_olih4d_time_series(raw) -> list[dict]:
     """
     Parse OLiH4d (date time series) response.
@@ -724,8 +1276,6 @@ def _parse_olih4d_time_series(raw) -> list[dict]:
     Each date_entry:
       [timestamp_ms, [clicks, impressions, ctr_float, position_float], None, ..., timestamp_ms]
     """
-    import datetime
-
     if not isinstance(raw, list) or len(raw) < 2:
         return []
 
@@ -736,35 +1286,47 @@ def _parse_olih4d_time_series(raw) -> list[dict]:
     except (IndexError, TypeError):
         return []
 
+    # Hot loop (one pass per day): bind lookups to locals
+    append = rows.append
+    gmtime, strftime = time.gmtime, time.strftime
+    _int, _float, _round, _list = int, float, round, list
+    _num = _NUM_TYPES
+
     for entry in date_entries:
-        if not isinstance(entry, list) or len(entry) < 2:
+        if not isinstance(entry, _list) or len(entry) < 2:
             continue
         ts_ms = entry[0]
         metrics = entry[1]
-        if not isinstance(ts_ms, (int, float)) or not isinstance(metrics, list):
+        if not isinstance(ts_ms, (int, float)) or not isinstance(metrics, _list):
             continue
 
         # Convert timestamp to date string
         try:
-            date_str = datetime.datetime.fromtimestamp(ts_ms / 1000, tz=datetime.timezone.utc).strftime("%Y-%m-%d")
+            date_str = strftime("%Y-%m-%d", gmtime(ts_ms // 1000))
         except (OSError, ValueError, OverflowError):
             date_str = str(ts_ms)
 
-        clicks = int(metrics[0]) if len(metrics) > 0 and isinstance(metrics[0], (int, float)) else 0
-        impressions = int(metrics[1]) if len(metrics) > 1 and isinstance(metrics[1], (int, float)) else 0
-        ctr_raw = metrics[2] if len(metrics) > 2 else 0
-        pos_raw = metrics[3] if len(metrics) > 3 else 0
-
-        try:
-            ctr = round(float(ctr_raw) * 100, 2) if isinstance(ctr_raw, (int, float)) else 0.0
-        except (ValueError, TypeError):
-            ctr = 0.0
-        try:
-            position = round(float(pos_raw), 1) if isinstance(pos_raw, (int, float)) else 0.0
-        except (ValueError, TypeError):
-            position = 0.0
+        # Fast path: all four metrics present and exactly int/float. Anything
+        # else (numeric strings, bools, nulls) gets the slow path's handling,
+        # which zeroes non-numbers instead of converting them
+        if (
+            len(metrics) >= 4
+            and type(metrics[0]) in _num
+            and type(metrics[1]) in _num
+            and type(metrics[2]) in _num
+            and type(metrics[3]) in _num
+        ):
+            try:
+                clicks = _int(metrics[0])
+                impressions = _int(metrics[1])
+                ctr = _round(_float(metrics[2]) * 100, 2)
+                position = _round(_float(metrics[3]), 1)
+            except (ValueError, OverflowError):
+                clicks, impressions, ctr, position = _olih4d_metrics_slow(metrics)
+        else:
+            clicks, impressions, ctr, position = _olih4d_metrics_slow(metrics)
 
-        rows.append({
+        append({
             "date": date_str,
             "clicks": clicks,
             "impressions": impressions,
@@ -788,7 +1350,7 @@ def _extract_metric_value(metric_array: list) -> float | None:
     Strategy: check index [1] first; if None/0, scan indices 9+ from the end
     (skipping index 8 which is the type code).
     """
-    if not isinstance(metric_array, list) or len(metric_array) < 2:
+    if type(metric_array) is not list or len(metric_array) < 2:
         return None
 
     val = metric_array[1]
@@ -811,90 +1373,164 @@ def _extract_metric_value(metric_array: list) -> float | None:
     return 0.0
 
 
-def _extract_dim_value(dim_info: list, dim_name: str) -> str | None:
-    """
-    Extract a human-readable dimension value from the complex dim_info array.
+# Shared instances of low-cardinality dimension values (countries, devices),
+# so a 25k-row breakdown holds a few dozen strings instead of one per row
+_VALUE_POOL: dict[str, str] = {}
+_VALUE_POOL_MAX = 4096
 
-    GSC nDAfwb stores dimension values at different positions depending on type:
-      - query: index 0 (plain string)
-      - page:  index 40 (URL string)
-      - country: index 17 (dict like {"519508101": ["ind"]})
-      - device/search_type: index 0 (plain string like "WEB", "MOBILE")
-    """
-    if not isinstance(dim_info, list) or not dim_info:
-        return None
 
-    if dim_name == "query":
-        val = dim_info[0] if dim_info else None
-        return val if isinstance(val, str) else None
+def _pooled(value: str) -> str:
+    """Return the shared copy of a repeating dimension value."""
+    pooled = _VALUE_POOL.get(value)
+    if pooled is None:
+        if len(_VALUE_POOL) >= _VALUE_POOL_MAX:
+            _VALUE_POOL.clear()
+        pooled = _VALUE_POOL[value] = value
+    return pooled
 
-    if dim_name == "page":
-        if len(dim_info) > 40 and isinstance(dim_info[40], str):
-            return dim_info[40]
-        for v in reversed(dim_info):
-            if isinstance(v, str) and (v.startswith("http") or v.startswith("/")):
-                return v
-        return None
 
-    if dim_name == "country":
-        if len(dim_info) > 17 and isinstance(dim_info[17], dict):
-            for vals in dim_info[17].values():
+def _extract_query(dim_info: list) -> str | None:
+    """query: index 0 (plain string)."""
+    val = dim_info[0]
+    return val if isinstance(val, str) else None
+
+
+def _extract_page(dim_info: list) -> str | None:
+    """page: index 40 (URL string), else the last URL-looking string."""
+    if len(dim_info) > 40 and isinstance(dim_info[40], str):
+        return dim_info[40]
+    for v in reversed(dim_info):
+        if isinstance(v, str) and (v.startswith("http") or v.startswith("/")):
+            return v
+    return None
+
+
+def _extract_country(dim_info: list) -> str | None:
+    """country: index 17 (dict like {"519508101": ["ind"]}), else any such dict."""
+    if len(dim_info) > 17 and isinstance(dim_info[17], dict):
+        for vals in dim_info[17].values():
+            if isinstance(vals, list) and vals and isinstance(vals[0], str):
+                return _pooled(vals[0].upper())
+    for v in dim_info:
+        if isinstance(v, dict):
+            for vals in v.values():
                 if isinstance(vals, list) and vals and isinstance(vals[0], str):
-                    return vals[0].upper()
-        for v in dim_info:
-            if isinstance(v, dict):
-                for vals in v.values():
-                    if isinstance(vals, list) and vals and isinstance(vals[0], str):
-                        return vals[0].upper()
-        return None
+                    return _pooled(vals[0].upper())
+    return None
 
-    if dim_name == "device":
-        if isinstance(dim_info[0], str):
-            return dim_info[0]
-        return None
 
-    val = dim_info[0] if dim_info else None
+def _extract_device(dim_info: list) -> str | None:
+    """device/search_type: index 0 (plain string like "WEB", "MOBILE")."""
+    val = dim_info[0]
+    return _pooled(val) if isinstance(val, str) else None
+
+
+def _extract_other(dim_info: list) -> str | int | None:
+    """Any other dimension: index 0, stringified unless str/int."""
+    val = dim_info[0]
     return val if isinstance(val, (str, int)) else str(val) if val is not None else None
 
 
-def _parse_single_row(row_data: list, dimensions: list[str]) -> dict | None:
-    """Parse a single nDAfwb row: [dim_info, metric1, metric2, metric3, metric4]."""
-    if not isinstance(row_data, list) or len(row_data) < 2:
+# Where GSC nDAfwb keeps each dimension's value inside a row's dim_info
+# array. Dimension name → extractor; resolved once per parse, not per row
+_DIM_EXTRACTORS = {
+    "query":   _extract_query,
+    "page":    _extract_page,
+    "country": _extract_country,
+    "device":  _extract_device,
+}
+
+
+@lru_cache(maxsize=32)
+def _dim_extractors(dimensions: tuple[str, ...]) -> tuple:
+    """
+    ((dim_name, extractor), ...) for a dimension list, built once per
+    combination. Names are interned so every row dict shares the same key
+    objects.
+    """
+    return tuple(
+        (sys.intern(d), _DIM_EXTRACTORS.get(d, _extract_other)) for d in dimensions
+    )
+
+
+def _metric_count(value) -> int:
+    return int(value) if value is not None else 0
+
+
+def _metric_pct(value) -> float:
+    return round(float(value) * 100, 2) if value is not None else 0.0
+
+
+def _metric_position(value) -> float:
+    return round(float(value), 1) if value is not None else 0.0
+
+
+# nDAfwb metric type (metric_array[8]) → (row key, converter)
+_METRIC_HANDLERS = {
+    5: ("clicks", _metric_count),
+    6: ("impressions", _metric_count),
+    7: ("ctr", _metric_pct),
+    8: ("position", _metric_position),
+}
+_METRIC_DEFAULTS = {"clicks": 0, "impressions": 0, "ctr": 0.0, "position": 0.0}
+
+
+def _parse_single_row(row_data: list, extractors: tuple) -> dict | None:
+    """
+    Parse a single nDAfwb row: [dim_info, metric1, metric2, metric3, metric4].
+
+    `extractors` is ((dim_name, extractor), ...) from _dim_extractors().
+
+    Containers are checked with `type(x) is list` rather than isinstance():
+    the data comes straight from the JSON decoder, which only builds exact
+    builtin types, so subclasses can't occur and the exact check is cheaper.
+    """
+    _list = list
+    if type(row_data) is not _list or len(row_data) < 2:
         return None
 
     dim_info = row_data[0]
-    if not isinstance(dim_info, list) or len(dim_info) == 0:
+    if type(dim_info) is not _list or len(dim_info) == 0:
         return None
 
-    dim_values: dict[str, str | int] = {}
-    for dim_name in dimensions:
-        val = _extract_dim_value(dim_info, dim_name)
+    # One dict per row: dimension values first, then the metrics filled in
+    # place (no intermediate dicts merged at the end)
+    row: dict = {}
+    for dim_name, extract in extractors:
+        val = extract(dim_info)
         if val is not None:
-            dim_values[dim_name] = val
+            row[dim_name] = val
 
-    if not dim_values:
+    if not row:
         return None
 
-    metrics = {"clicks": 0, "impressions": 0, "ctr": 0.0, "position": 0.0}
+    row.update(_METRIC_DEFAULTS)
+    get_handler = _METRIC_HANDLERS.get
 
     for metric_array in row_data[1:]:
-        if not isinstance(metric_array, list) or len(metric_array) < 9:
+        if type(metric_array) is not _list or len(metric_array) < 9:
             continue
         metric_type = metric_array[8]
-        if not isinstance(metric_type, int):
+        # a list/dict here would be unhashable — skip it, not the whole parse
+        if type(metric_type) is not int:
             continue
-        value = _extract_metric_value(metric_array)
+        handler = get_handler(metric_type)
+        if handler is None:
+            continue
+        key, convert = handler
+        row[key] = convert(_extract_metric_value(metric_array))
+
+    return row
 
-        if metric_type == 5:
-            metrics["clicks"] = int(value) if value is not None else 0
-        elif metric_type == 6:
-            metrics["impressions"] = int(value) if value is not None else 0
-        elif metric_type == 7:
-            metrics["ctr"] = round(float(value) * 100, 2) if value is not None else 0.0
-        elif metric_type == 8:
-            metrics["position"] = round(float(value), 1) if value is not None else 0.0
 
-    return {**dim_values, **metrics}
+def _wrapper_depth(item: list) -> int:
+    """Number of single-element wrappers around a row: [[row_data]] -> 1."""
+    depth = 0
+    while (type(item) is list and len(item) == 1
+           and type(item[0]) is list and type(item[0][0]) is list):
+        item = item[0]
+        depth += 1
+    return depth
 
 
 def _parse_ndafwb_breakdown(raw, dimensions: list[str]) -> list[dict]:
@@ -923,17 +1559,33 @@ def _parse_ndafwb_breakdown(raw, dimensions: list[str]) -> list[dict]:
         if not isinstance(candidates, list):
             return _parse_ndafwb_fallback(raw, dimensions)
 
+        extractors = _dim_extractors(tuple(dimensions))
+
+        _list = list  # exact type checks: see _parse_single_row
+        depth = None
         for item in candidates:
-            if not isinstance(item, list) or len(item) == 0:
+            if type(item) is not _list or len(item) == 0:
                 continue
 
-            # Unwrap nested wrappers: [[row_data]] -> [row_data]
-            row_data = item
-            while (isinstance(row_data, list) and len(row_data) == 1
-                   and isinstance(row_data[0], list) and isinstance(row_data[0][0], list)):
-                row_data = row_data[0]
+            if depth is None:
+                # Wrapper nesting ([[row_data]] vs [row_data]) is uniform
+                # across a response: measure it once, on the first row
+                depth = _wrapper_depth(item)
 
-            parsed = _parse_single_row(row_data, dimensions)
+            row_data = item
+            try:
+                for _ in range(depth):
+                    row_data = row_data[0]
+            except (IndexError, TypeError):
+                row_data = None
+
+            parsed = _parse_single_row(row_data, extractors)
+            if parsed is None and _wrapper_depth(item) != depth:
+                # Odd row out: unwrap it individually
+                row_data = item
+                for _ in range(_wrapper_depth(item)):
+                    row_data = row_data[0]
+                parsed = _parse_single_row(row_data, extractors)
             if parsed:
                 rows.append(parsed)
 
@@ -945,6 +1597,14 @@ def _parse_ndafwb_breakdown(raw, dimensions: list[str]) -> list[dict]:
     return rows
 
 
+# Exact types accepted for the clicks/impressions slots of a fallback row
+_NUM_TYPES = frozenset({int, float})
+
+# The fallback walk doesn't descend past this nesting depth; real nDAfwb
+# payloads are a dozen levels deep at most
+_FALLBACK_MAX_DEPTH = 64
+
+
 def _parse_ndafwb_fallback(raw, dimensions: list[str]) -> list[dict]:
     """
     Fallback parser using heuristic scan (old method).
@@ -954,41 +1614,62 @@ def _parse_ndafwb_fallback(raw, dimensions: list[str]) -> list[dict]:
         return []
 
     rows = []
-
-    def scan_for_rows(node):
-        if isinstance(node, list):
-            if len(node) >= 2 + len(dimensions):
-                # Check if last 4 elements look like [clicks, impressions, ctr, position]
+    append = rows.append
+    n_dims = len(dimensions)
+    min_len = max(2 + n_dims, 4)  # dims + the 4 metrics need at least this many
+    num_types = _NUM_TYPES
+    _float, _str, _int = float, str, int
+    dim_names = [sys.intern(d) for d in dimensions]
+
+    # Depth-first walk with an explicit stack of (node, depth) (children
+    # pushed in reverse so rows come out in document order); a node that
+    # matches the row shape is taken whole and not descended into. Only
+    # containers are pushed, and nothing below _FALLBACK_MAX_DEPTH.
+    # Exact builtin types from the JSON decoder: see _parse_single_row
+    _list, _dict = list, dict
+    max_depth = _FALLBACK_MAX_DEPTH
+    stack = [(raw, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_type = type(node)
+        if node_type is _list:
+            if len(node) >= min_len:
+                # Check if last 4 elements look like [clicks, impressions, ctr, position],
+                # most selective test first (most nodes have no float at [-1])
                 tail = node[-4:]
-                head = node[:len(dimensions)]
-                metrics_ok = (
-                    len(tail) == 4 and
-                    isinstance(tail[0], (int, float)) and
-                    isinstance(tail[1], (int, float)) and
-                    isinstance(tail[2], float) and
-                    isinstance(tail[3], float)
-                )
-                dims_ok = all(isinstance(v, (str, int)) for v in head)
-                if metrics_ok and dims_ok:
-                    row = {}
-                    for i, dim_name in enumerate(dimensions):
-                        row[dim_name] = head[i]
-                    row.update({
-                        "clicks": int(tail[0]),
-                        "impressions": int(tail[1]),
-                        "ctr": round(tail[2] * 100, 2),
-                        "position": round(tail[3], 1),
-                    })
-                    rows.append(row)
-                    return
+                if (
+                    type(tail[3]) is _float
+                    and type(tail[2]) is _float
+                    and type(tail[0]) in num_types
+                    and type(tail[1]) in num_types
+                ):
+                    head = node[:n_dims]
+                    for v in head:
+                        t = type(v)
+                        if t is not _str and t is not _int:
+                            break
+                    else:
+                        row = dict(zip(dim_names, head))
+                        row["clicks"] = int(tail[0])
+                        row["impressions"] = int(tail[1])
+                        row["ctr"] = round(tail[2] * 100, 2)
+                        row["position"] = round(tail[3], 1)
+                        append(row)
+                        continue
+
+            children = reversed(node)
+        elif node_type is _dict:
+            children = reversed(node.values())
+        else:
+            continue
 
-            for item in node:
-                scan_for_rows(item)
-        elif isinstance(node, dict):
-            for v in node.values():
-                scan_for_rows(v)
+        if depth < max_depth:
+            depth += 1
+            stack.extend([
+                (child, depth) for child in children
+                if type(child) is _list or type(child) is _dict
+            ])
 
-    scan_for_rows(raw)
     return rows
 
 
@@ -1007,6 +1688,8 @@ async def get_coverage_stats(
     Returns:
         Dict with raw coverage data from GSC
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
@@ -1028,6 +1711,8 @@ async def get_stats_panel(
     Returns:
         Dict with raw stats data
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
@@ -1055,10 +1740,21 @@ async def get_sitemaps(
 
     Returns:
         Dict with submitted, indexed, errors counts and sitemap URL list
+        (cached for RPC_CACHE_TTL seconds; treat as read-only)
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
+    return await _rpc_cache.get_or_fetch(
+        (RPC_SITEMAPS, site_url, _sapisid_fingerprint(cookies)),
+        lambda: _get_sitemaps(site_url, cookies),
+    )
+
+
+async def _get_sitemaps(site_url: str, cookies: dict[str, str]) -> dict:
+    """get_sitemaps() minus input checks and caching."""
     raw = await _batchexecute(RPC_SITEMAPS, [site_url, 7], cookies)
 
     result: dict = {
@@ -1118,6 +1814,8 @@ async def get_insights(
     Returns:
         Dict with parsed callouts list and raw data
     """
+    site_url = normalize_site_url(site_url)
+
     if cookies is None:
         cookies = get_google_cookies()
 
@@ -16,46 +16,52 @@ Includes a 5-minute TTL cache to avoid repeated disk reads per session.
 import os
 import time
 import logging
+from itertools import chain
+from types import SimpleNamespace
 from typing import Optional
 
-try:
-    import rookiepy
-except ImportError as e:
-    raise ImportError(
-        "rookiepy is required. Install with: pip install rookiepy"
-    ) from e
-
 logger = logging.getLogger(__name__)
 
 # ─── TTL Cache ────────────────────────────────────────────────────────────────
 
 CACHE_TTL = 300  # 5 minutes
 
-_cache: dict = {
-    "google": {"data": None, "expires": 0.0},
+# Expiry uses the monotonic clock so NTP/wall-clock jumps can't revive or
+# prematurely expire an entry. `headers` holds the (auth-only, full) Cookie
+# header strings for `data`, built once per refresh.
+_cache: dict[str, SimpleNamespace] = {
+    "google": SimpleNamespace(data=None, expires=0.0, headers=None),
 }
 
 
+def _get_cache(key: str) -> Optional[dict]:
+    entry = _cache[key]
+    if entry.data is not None and time.monotonic() < entry.expires:
+        return entry.data
+    return None
+
+
 def _is_cached(key: str) -> bool:
-    return (
-        _cache[key]["data"] is not None
-        and time.time() < _cache[key]["expires"]
-    )
+    return _get_cache(key) is not None
 
 
 def _set_cache(key: str, data: dict) -> None:
-    _cache[key]["data"] = data
-    _cache[key]["expires"] = time.time() + CACHE_TTL
+    entry = _cache[key]
+    entry.data = data
+    entry.expires = time.monotonic() + CACHE_TTL
+    entry.headers = (_join_auth_cookies(data), _join_all_cookies(data))
 
 
-def _get_cache(key: str) -> Optional[dict]:
-    return _cache[key]["data"] if _is_cached(key) else None
+def _cached_headers(cookies: dict[str, str]) -> Optional[tuple[str, str]]:
+    """The precomputed Cookie headers, if `cookies` is the cached cookie set."""
+    entry = _cache["google"]
+    return entry.headers if cookies is entry.data else None
 
 
 # ─── Google Cookies ────────────────────────────────────────────────────────────
 
 # Names of cookies needed for GSC SAPISIDHASH auth
-GOOGLE_COOKIE_NAMES = {
+GOOGLE_COOKIE_NAMES = frozenset({
     "SAPISID",
     "__Secure-1PAPISID",
     "__Secure-3PAPISID",
@@ -67,14 +73,41 @@ GOOGLE_COOKIE_NAMES = {
     "APISID",
     "OSID",
     "NID",
+})
+
+# Header order for the named cookies, sorted once instead of per request
+_GOOGLE_COOKIE_NAMES_SORTED = tuple(sorted(GOOGLE_COOKIE_NAMES))
+
+# Any other cookie with one of these prefixes is also sent as auth context
+_AUTH_COOKIE_PREFIXES = ("__Host-", "__Secure-")
+
+# Browsers in order of preference: name -> rookiepy reader function name
+_BROWSER_EXTRACTORS: dict[str, str] = {
+    "chrome": "chrome",
+    "brave": "brave",
+    "edge": "edge",
 }
 
-# Browser extractors in order of preference
-_BROWSER_EXTRACTORS = [
-    ("chrome", lambda: rookiepy.chrome(["google.com"])),
-    ("brave", lambda: rookiepy.brave(["google.com"])),
-    ("edge", lambda: rookiepy.edge(["google.com"])),
-]
+
+def _require_rookiepy():
+    """
+    Import rookiepy on first use.
+
+    It's a compiled extension with noticeable load time, and a server that
+    only ever serves cached cookies never needs it.
+    """
+    try:
+        import rookiepy
+    except ImportError as e:
+        raise RuntimeError(
+            "rookiepy is required. Install with: pip install rookiepy"
+        ) from e
+    return rookiepy
+
+
+def _read_browser_cookies(reader: str) -> list:
+    """Call rookiepy's reader for one browser, scoped to google.com."""
+    return getattr(_require_rookiepy(), reader)(["google.com"])
 
 
 def _raw_cookies_to_dict(raw_cookies: list) -> dict[str, str]:
@@ -97,10 +130,31 @@ def _has_sapisid(cookies: dict[str, str]) -> bool:
     )
 
 
-def _try_extract_from_browser(browser_name: str, fn) -> Optional[dict[str, str]]:
-    """Try to extract Google cookies from a single browser. Returns None on failure."""
+def _describe_extraction_error(browser_name: str, e: Exception) -> str:
+    """Turn a rookiepy failure into a short, user-facing reason."""
+    error_str = str(e).lower()
+    if "locked" in error_str or "busy" in error_str:
+        return f"{browser_name}: database locked (close {browser_name} and retry)"
+    if "permission" in error_str or "access" in error_str:
+        return f"{browser_name}: permission denied"
+    if "no such file" in error_str or "not found" in error_str:
+        return f"{browser_name}: not installed"
+    return f"{browser_name}: {e}"
+
+
+def _try_extract_from_browser(
+    browser_name: str,
+    reader: str,
+    errors: Optional[list[str]] = None,
+) -> Optional[dict[str, str]]:
+    """
+    Try to extract Google cookies from a single browser. Returns None on failure.
+
+    If `errors` is given, a readable reason is appended to it when the
+    browser's cookie store can't be read.
+    """
     try:
-        raw = fn()
+        raw = _read_browser_cookies(reader)
         if not raw:
             return None
         cookies = _raw_cookies_to_dict(raw)
@@ -112,6 +166,8 @@ def _try_extract_from_browser(browser_name: str, fn) -> Optional[dict[str, str]]
             return None
     except Exception as e:
         logger.debug(f"{browser_name} cookie extraction failed: {e}")
+        if errors is not None:
+            errors.append(_describe_extraction_error(browser_name, e))
         return None
 
 
@@ -137,6 +193,7 @@ def get_google_cookies(force_refresh: bool = False) -> dict[str, str]:
             return cached
 
     logger.debug("Extracting Google cookies...")
+    _require_rookiepy()  # fail with the install hint, not a per-browser error
 
     browser_override = os.environ.get("BROWSER", "").lower().strip()
     profile_override = os.environ.get("CHROME_PROFILE", "").strip()
@@ -148,7 +205,7 @@ def get_google_cookies(force_refresh: bool = False) -> dict[str, str]:
     if profile_override:
         logger.debug(f"Using CHROME_PROFILE override: {profile_override}")
         try:
-            raw = rookiepy.chrome(["google.com"])  # rookiepy reads default profile
+            raw = _read_browser_cookies("chrome")  # rookiepy reads default profile
             # Note: rookiepy doesn't support explicit profile path yet;
             # this is a best-effort attempt
             cookies = _raw_cookies_to_dict(raw)
@@ -159,44 +216,28 @@ def get_google_cookies(force_refresh: bool = False) -> dict[str, str]:
 
     # 2. BROWSER env var override
     if cookies is None and browser_override:
-        extractor_map = {name: fn for name, fn in _BROWSER_EXTRACTORS}
-        if browser_override in extractor_map:
+        if browser_override in _BROWSER_EXTRACTORS:
             logger.debug(f"Using BROWSER override: {browser_override}")
-            cookies = _try_extract_from_browser(browser_override, extractor_map[browser_override])
+            cookies = _try_extract_from_browser(
+                browser_override, _BROWSER_EXTRACTORS[browser_override]
+            )
             if cookies:
                 used_browser = browser_override
         else:
             logger.warning(
                 f"BROWSER={browser_override!r} is not supported. "
-                f"Valid options: {list(extractor_map.keys())}"
+                f"Valid options: {list(_BROWSER_EXTRACTORS)}"
             )
 
     # 3. Auto-detect: try each browser in order
     if cookies is None:
-        errors = []
-        for browser_name, fn in _BROWSER_EXTRACTORS:
-            try:
-                raw = fn()
-                if not raw:
-                    continue
-                candidate = _raw_cookies_to_dict(raw)
-                if _has_sapisid(candidate):
-                    cookies = candidate
-                    used_browser = browser_name
-                    logger.debug(f"Auto-detected: using {browser_name} ({len(cookies)} cookies)")
-                    break
-                else:
-                    logger.debug(f"  {browser_name}: {len(candidate)} cookies but no SAPISID")
-            except Exception as e:
-                error_str = str(e).lower()
-                if "locked" in error_str or "busy" in error_str:
-                    errors.append(f"{browser_name}: database locked (close {browser_name} and retry)")
-                elif "permission" in error_str or "access" in error_str:
-                    errors.append(f"{browser_name}: permission denied")
-                elif "no such file" in error_str or "not found" in error_str:
-                    errors.append(f"{browser_name}: not installed")
-                else:
-                    errors.append(f"{browser_name}: {e}")
+        errors: list[str] = []
+        for browser_name, reader in _BROWSER_EXTRACTORS.items():
+            cookies = _try_extract_from_browser(browser_name, reader, errors)
+            if cookies:
+                used_browser = browser_name
+                logger.debug(f"Auto-detected: using {browser_name} ({len(cookies)} cookies)")
+                break
 
         if cookies is None:
             error_detail = "; ".join(errors) if errors else "No browsers found"
@@ -235,19 +276,8 @@ def build_cookie_header(cookies: dict[str, str]) -> str:
     Build a Cookie header string from a dict of cookie name→value pairs.
     Includes all Google auth cookies (named + __Host-/__Secure- prefixed).
     """
-    parts = []
-
-    # Priority cookies first
-    for name in sorted(GOOGLE_COOKIE_NAMES):
-        if name in cookies:
-            parts.append(f"{name}={cookies[name]}")
-
-    # Also include any __Host- and __Secure- prefixed cookies
-    for name, value in cookies.items():
-        if (name.startswith("__Host-") or name.startswith("__Secure-")) and name not in GOOGLE_COOKIE_NAMES:
-            parts.append(f"{name}={value}")
-
-    return "; ".join(parts)
+    cached = _cached_headers(cookies)
+    return cached[0] if cached else _join_auth_cookies(cookies)
 
 
 def get_all_cookies_header(cookies: Optional[dict[str, str]] = None) -> str:
@@ -257,11 +287,30 @@ def get_all_cookies_header(cookies: Optional[dict[str, str]] = None) -> str:
     """
     if cookies is None:
         cookies = get_google_cookies()
+    cached = _cached_headers(cookies)
+    return cached[1] if cached else _join_all_cookies(cookies)
+
+
+def _join_auth_cookies(cookies: dict[str, str]) -> str:
+    # Priority cookies first, then any other __Host-/__Secure- prefixed ones
+    return "; ".join(chain(
+        (f"{name}={cookies[name]}" for name in _GOOGLE_COOKIE_NAMES_SORTED if name in cookies),
+        (
+            f"{name}={value}"
+            for name, value in cookies.items()
+            if name.startswith(_AUTH_COOKIE_PREFIXES) and name not in GOOGLE_COOKIE_NAMES
+        ),
+    ))
+
+
+def _join_all_cookies(cookies: dict[str, str]) -> str:
     return "; ".join(f"{k}={v}" for k, v in cookies.items())
 
 
 def clear_cookie_cache() -> None:
     """Force clear the cookie cache (useful after re-login)."""
-    _cache["google"]["data"] = None
-    _cache["google"]["expires"] = 0.0
+    entry = _cache["google"]
+    entry.data = None
+    entry.expires = 0.0
+    entry.headers = None
     logger.debug("Cookie cache cleared")
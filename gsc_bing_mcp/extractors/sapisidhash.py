@@ -17,6 +17,7 @@ References:
 import hashlib
 import time
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from .chrome_cookies import get_google_cookies, get_sapisid, build_cookie_header
@@ -35,6 +36,27 @@ CHROME_USER_AGENT = (
 )
 
 
+@lru_cache(maxsize=8)
+def _suffix_bytes(sapisid: str, origin: str) -> bytes:
+    """The session-constant " {SAPISID} {origin}" tail of the hashed message."""
+    return f" {sapisid} {origin}".encode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _sapisidhash_at(timestamp: int, sapisid: str, origin: str) -> str:
+    """
+    SAPISIDHASH for one whole-second timestamp.
+
+    Keyed on the timestamp, so parallel requests issued within the same
+    second share one hash and older seconds simply age out of the LRU.
+    SHA-1 is dictated by Google's scheme rather than chosen for security,
+    hence usedforsecurity=False (keeps it usable on FIPS-mode OpenSSL).
+    """
+    h = hashlib.sha1(str(timestamp).encode("ascii"), usedforsecurity=False)
+    h.update(_suffix_bytes(sapisid, origin))
+    return f"SAPISIDHASH {timestamp}_{h.hexdigest()}"
+
+
 def compute_sapisidhash(sapisid: str, origin: str = GSC_ORIGIN) -> str:
     """
     Compute the SAPISIDHASH value.
@@ -46,10 +68,28 @@ def compute_sapisidhash(sapisid: str, origin: str = GSC_ORIGIN) -> str:
     Returns:
         SAPISIDHASH string in format: "SAPISIDHASH {timestamp}_{hex_digest}"
     """
-    timestamp = int(time.time())
-    message = f"{timestamp} {sapisid} {origin}"
-    digest = hashlib.sha1(message.encode("utf-8")).hexdigest()
-    return f"SAPISIDHASH {timestamp}_{digest}"
+    return _sapisidhash_at(int(time.time()), sapisid, origin)
+
+
+@lru_cache(maxsize=8)
+def _session_headers(cookie_header: str, origin: str) -> dict[str, str]:
+    """
+    Every auth header except Authorization — constant for a cookie set, so
+    built once and shared (read-only; callers get a fresh merged dict).
+    """
+    return {
+        "Cookie": cookie_header,
+        "X-Origin": origin,
+        "X-Referer": origin,
+        "Origin": origin,
+        "Referer": f"{origin}/search-console/performance/search-analytics",
+        "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+        "User-Agent": CHROME_USER_AGENT,
+        "Accept": "*/*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "X-Goog-Authuser": "0",
+        "X-Same-Domain": "1",
+    }
 
 
 def get_gsc_auth_headers(
@@ -74,22 +114,9 @@ def get_gsc_auth_headers(
         cookies = get_google_cookies()
 
     sapisid = get_sapisid(cookies)
-    sapisidhash = compute_sapisidhash(sapisid, origin)
-    cookie_header = build_cookie_header(cookies)
-
     headers = {
-        "Authorization": sapisidhash,
-        "Cookie": cookie_header,
-        "X-Origin": origin,
-        "X-Referer": origin,
-        "Origin": origin,
-        "Referer": f"{origin}/search-console/performance/search-analytics",
-        "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-        "User-Agent": CHROME_USER_AGENT,
-        "Accept": "*/*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "X-Goog-Authuser": "0",
-        "X-Same-Domain": "1",
+        "Authorization": compute_sapisidhash(sapisid, origin),
+        **_session_headers(build_cookie_header(cookies), origin),
     }
 
     logger.debug(f"Built GSC auth headers with SAPISIDHASH")
@@ -12,9 +12,9 @@ Authentication:
 
 Transport: stdio (runs locally on user's machine, launched by Cline/Claude Desktop)
 
-Tools (23 total):
+Tools (24 total):
   GSC:  gsc_list_sites, gsc_performance_trend, gsc_top_queries,
-        gsc_top_pages, gsc_search_analytics, gsc_site_summary,
+        gsc_top_pages, gsc_overview, gsc_search_analytics, gsc_site_summary,
         gsc_list_sitemaps, gsc_insights, gsc_all_queries,
         gsc_index_coverage, gsc_query_pages
   Bing: bing_list_sites, bing_search_analytics, bing_crawl_stats,
@@ -24,15 +24,22 @@ Tools (23 total):
   Util: refresh_google_session
 """
 
-import json
+import asyncio
+import functools
 import logging
+import os
+import re
 import sys
+from contextlib import asynccontextmanager
+from heapq import nlargest
+from operator import itemgetter
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from ._json import dumps, dumps_pretty
 from .clients import gsc_client, bing_client
-from .extractors.chrome_cookies import clear_cookie_cache
+from .extractors.chrome_cookies import clear_cookie_cache, get_google_cookies
 
 # Configure logging (stderr so it doesn't interfere with stdio MCP protocol)
 logging.basicConfig(
@@ -43,6 +50,122 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Tool results are read by the model, not a person: compact JSON is a
+# fraction of the size. GSC_BING_PRETTY=1 restores indented output.
+_PRETTY_JSON = os.environ.get("GSC_BING_PRETTY", "").strip().lower() in ("1", "true", "yes")
+_to_json = dumps_pretty if _PRETTY_JSON else dumps
+
+
+def _repr_chunks(obj):
+    """Yield str(obj) piece by piece for decoded JSON (lists, dicts, scalars)."""
+    t = type(obj)
+    if t is list:
+        yield "["
+        for i, item in enumerate(obj):
+            if i:
+                yield ", "
+            yield from _repr_chunks(item)
+        yield "]"
+    elif t is dict:
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                yield ", "
+            yield repr(key)
+            yield ": "
+            yield from _repr_chunks(value)
+        yield "}"
+    else:
+        yield repr(obj)
+
+
+def _preview(raw, limit: int) -> str:
+    """
+    str(raw)[:limit] for decoded JSON, without stringifying the whole tree.
+
+    Raw GSC responses can run to megabytes; only the first `limit`
+    characters are ever shown, so generation stops once they are produced.
+    """
+    if type(raw) is str:
+        return raw[:limit]
+    parts = []
+    size = 0
+    for chunk in _repr_chunks(raw):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+# Sort keys for result rows. The GSC and Bing row parsers always fill in
+# every metric, so plain C-level itemgetters are safe (no .get() defaults).
+_by_clicks = itemgetter("clicks")
+_by_clicks_impressions = itemgetter("clicks", "impressions")
+
+
+def _top_rows(rows: list[dict], limit: int, key=_by_clicks) -> list[dict]:
+    """
+    The `limit` rows ranked highest by `key`, highest first (all rows if
+    limit <= 0).
+
+    For a small `limit` nlargest keeps only `limit` candidates instead of
+    sorting every row, and breaks ties in input order exactly like a stable
+    sort would. Near the full length a sort-and-slice is cheaper.
+    """
+    if limit <= 0 or limit >= len(rows):
+        return sorted(rows, key=key, reverse=True)
+    if limit < len(rows) // 4:
+        return nlargest(limit, rows, key=key)
+    return sorted(rows, key=key, reverse=True)[:limit]
+
+
+# Responses built from at least this many rows are sorted and encoded in a
+# worker thread, so the event loop gets turns to serve other tool calls
+# (orjson holds the GIL while encoding, so this shortens stalls rather than
+# removing them). Smaller responses take well under a millisecond inline.
+_OFFLOAD_ROWS = 5000
+
+
+async def _finish_off_loop(n_rows: int, finish) -> str:
+    """Run `finish()` (sort + encode a response) in a thread if `n_rows` is large."""
+    if n_rows < _OFFLOAD_ROWS:
+        return finish()
+    return await asyncio.to_thread(finish)
+
+
+def _tool_errors(*expected: type[Exception]):
+    """
+    Turn a tool's exceptions into error strings for the model.
+
+    `expected` errors (auth, API and validation failures the clients raise
+    with a readable message) become "❌ Error: ..."; anything else is
+    logged with its traceback and returned as "❌ Unexpected error: ...".
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except expected as e:
+                return f"❌ Error: {e}"
+            except Exception as e:
+                logger.exception(f"Unexpected error in {fn.__name__}")
+                return f"❌ Unexpected error: {e}"
+        return wrapper
+    return decorate
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP):
+    """Close the shared HTTP clients when the server shuts down."""
+    try:
+        yield
+    finally:
+        await gsc_client.aclose()
+        await bing_client.aclose()
+
+
 # Create the FastMCP server
 mcp = FastMCP(
     name="GSC & Bing Webmaster",
@@ -54,17 +177,23 @@ mcp = FastMCP(
         "Site URLs must match exactly as they appear in each tool "
         "(e.g., 'https://example.com/' with trailing slash, or 'sc-domain:example.com' for GSC domain properties). "
         "Note: GSC data has a ~2-3 day lag. For best results use gsc_performance_trend "
-        "which returns daily data, or gsc_top_queries/gsc_top_pages for dimension breakdowns. "
+        "which returns daily data, or gsc_top_queries/gsc_top_pages for dimension breakdowns "
+        "(gsc_overview fetches both at once). "
         "GSC tools now support optional start_date/end_date params (YYYY-MM-DD). "
         "Use gsc_all_queries for HTML-based extraction of all queries. "
         "Use bing_submit_url / bing_submit_url_batch to request Bing indexing."
     ),
+    lifespan=_lifespan,
 )
 
+# Tools are registered with structured_output=False: they return JSON text,
+# and FastMCP would otherwise also echo that whole string back as
+# structuredContent {"result": ...}, sending every payload over stdio twice.
+
 
 # ─── GSC Tools ────────────────────────────────────────────────────────────────
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def gsc_list_sites() -> str:
     """
     List all verified properties/sites in your Google Search Console account.
@@ -88,7 +217,7 @@ async def gsc_list_sites() -> str:
                 "permissionLevel": site.get("permissionLevel", "siteOwner"),
                 "propertyType": prop_type,
             })
-        return json.dumps(result, indent=2)
+        return _to_json(result)
 
     except RuntimeError as e:
         return (
@@ -101,7 +230,8 @@ async def gsc_list_sites() -> str:
         return f"❌ Unexpected error: {e}"
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def gsc_performance_trend(
     site_url: str,
     search_type: str = "WEB",
@@ -123,53 +253,52 @@ async def gsc_performance_trend(
         start_date: Optional start date in YYYY-MM-DD format (default: ~17 days ago)
         end_date: Optional end date in YYYY-MM-DD format (default: ~3 days ago, due to GSC lag)
     """
-    try:
-        result = await gsc_client.query_search_analytics(
-            site_url=site_url,
-            dimensions=["date"],
-            search_type=search_type,
-            start_date=start_date or None,
-            end_date=end_date or None,
-        )
-
-        rows = result.get("rows", [])
-        if not rows:
-            note = result.get("note", "")
-            return (
-                f"No performance data found for {site_url}. {note}\n"
-                "Ensure the site is verified in Google Search Console and has received traffic."
-            )
-
-        # Calculate totals
-        total_clicks = sum(r.get("clicks", 0) for r in rows)
-        total_impressions = sum(r.get("impressions", 0) for r in rows)
-        avg_ctr = round(total_clicks / total_impressions * 100, 2) if total_impressions > 0 else 0.0
-        avg_position = round(
-            sum(r.get("position", 0) * r.get("impressions", 0) for r in rows) /
-            max(total_impressions, 1), 1
+    result = await gsc_client.query_search_analytics(
+        site_url=site_url,
+        dimensions=["date"],
+        search_type=search_type,
+        start_date=start_date or None,
+        end_date=end_date or None,
+    )
+
+    rows = result.get("rows", [])
+    if not rows:
+        note = result.get("note", "")
+        return (
+            f"No performance data found for {site_url}. {note}\n"
+            "Ensure the site is verified in Google Search Console and has received traffic."
         )
 
-        return json.dumps({
-            "site": site_url,
-            "search_type": search_type,
-            "summary": {
-                "total_clicks": total_clicks,
-                "total_impressions": total_impressions,
-                "avg_ctr_pct": avg_ctr,
-                "avg_position": avg_position,
-                "days_with_data": len(rows),
-            },
-            "daily_data": rows,
-        }, indent=2)
-
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_performance_trend")
-        return f"❌ Unexpected error: {e}"
-
-
-@mcp.tool()
+    # Calculate totals (one pass over the daily rows)
+    total_clicks = total_impressions = 0
+    weighted_position = 0.0
+    for r in rows:
+        impressions = r.get("impressions", 0)
+        total_clicks += r.get("clicks", 0)
+        total_impressions += impressions
+        weighted_position += r.get("position", 0) * impressions
+    if total_impressions > 0:
+        avg_ctr = round(total_clicks / total_impressions * 100, 2)
+        avg_position = round(weighted_position / total_impressions, 1)
+    else:
+        avg_ctr = avg_position = 0.0
+
+    return _to_json({
+        "site": site_url,
+        "search_type": search_type,
+        "summary": {
+            "total_clicks": total_clicks,
+            "total_impressions": total_impressions,
+            "avg_ctr_pct": avg_ctr,
+            "avg_position": avg_position,
+            "days_with_data": len(rows),
+        },
+        "daily_data": rows,
+    })
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def gsc_top_queries(
     site_url: str,
     limit: int = 25,
@@ -191,51 +320,37 @@ async def gsc_top_queries(
         start_date: Optional start date in YYYY-MM-DD format
         end_date: Optional end date in YYYY-MM-DD format
     """
-    try:
-        result = await gsc_client.query_search_analytics(
-            site_url=site_url,
-            dimensions=["query"],
-            search_type=search_type,
-            start_date=start_date or None,
-            end_date=end_date or None,
-        )
-
-        rows = result.get("rows", [])
-        if not rows:
-            return (
-                f"No query data found for {site_url}.\n"
-                "The site may have no search traffic or data may not be available yet. "
-                "Use gsc_performance_trend to see daily aggregate data."
-            )
-
-        # Sort by clicks (descending) then impressions (descending)
-        rows_sorted = sorted(
-            rows,
-            key=lambda r: (r.get("clicks", 0), r.get("impressions", 0)),
-            reverse=True
+    result = await gsc_client.query_search_analytics(
+        site_url=site_url,
+        dimensions=["query"],
+        search_type=search_type,
+        start_date=start_date or None,
+        end_date=end_date or None,
+    )
+
+    rows = result.get("rows", [])
+    if not rows:
+        return (
+            f"No query data found for {site_url}.\n"
+            "The site may have no search traffic or data may not be available yet. "
+            "Use gsc_performance_trend to see daily aggregate data."
         )
-        
-        # Apply limit (0 means return all)
-        if limit > 0:
-            rows_sorted = rows_sorted[:limit]
 
-        return json.dumps({
-            "site": site_url,
-            "search_type": search_type,
-            "top_queries": rows_sorted,
-            "total_shown": len(rows_sorted),
-            "total_available": len(rows),
-            "source": "batchexecute",
-        }, indent=2)
+    # Top rows by clicks then impressions (limit 0 means return all)
+    rows_sorted = _top_rows(rows, limit, _by_clicks_impressions)
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_top_queries")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "search_type": search_type,
+        "top_queries": rows_sorted,
+        "total_shown": len(rows_sorted),
+        "total_available": len(rows),
+        "source": "batchexecute",
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def gsc_top_pages(
     site_url: str,
     limit: int = 25,
@@ -258,44 +373,97 @@ async def gsc_top_pages(
         start_date: Optional start date in YYYY-MM-DD format
         end_date: Optional end date in YYYY-MM-DD format
     """
-    try:
-        result = await gsc_client.query_search_analytics(
+    result = await gsc_client.query_search_analytics(
+        site_url=site_url,
+        dimensions=["page"],
+        search_type=search_type,
+        start_date=start_date or None,
+        end_date=end_date or None,
+    )
+
+    rows = result.get("rows", [])
+    if not rows:
+        note = result.get("note", "")
+        return (
+            f"No page data found for {site_url}. {note}\n"
+            "Note: GSC only shows page breakdowns when a site has enough traffic. "
+            "Use gsc_performance_trend to see daily aggregate data."
+        )
+
+    rows_sorted = _top_rows(rows, limit)
+
+    return _to_json({
+        "site": site_url,
+        "search_type": search_type,
+        "top_pages": rows_sorted,
+        "total_shown": len(rows_sorted),
+        "total_available": len(rows),
+    })
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
+async def gsc_overview(
+    site_url: str,
+    limit: int = 25,
+    search_type: str = "WEB",
+    start_date: str = "",
+    end_date: str = "",
+) -> str:
+    """
+    Get the top queries AND top pages for a site in one call.
+
+    Fetches both breakdowns from Google Search Console concurrently, so it
+    is faster than calling gsc_top_queries and gsc_top_pages one after the
+    other. Prefer it when you need both (e.g. for an SEO overview).
+
+    Args:
+        site_url: The verified property URL (e.g., "https://example.com/")
+        limit: Number of top queries and of top pages to return (default 25, use 0 for all)
+        search_type: "WEB" (default), "IMAGE", "VIDEO", "NEWS"
+        start_date: Optional start date in YYYY-MM-DD format
+        end_date: Optional end date in YYYY-MM-DD format
+    """
+    queries_result, pages_result = await asyncio.gather(*(
+        gsc_client.query_search_analytics(
             site_url=site_url,
-            dimensions=["page"],
+            dimensions=[dimension],
             search_type=search_type,
             start_date=start_date or None,
             end_date=end_date or None,
         )
+        for dimension in ("query", "page")
+    ))
 
-        rows = result.get("rows", [])
-        if not rows:
-            note = result.get("note", "")
-            return (
-                f"No page data found for {site_url}. {note}\n"
-                "Note: GSC only shows page breakdowns when a site has enough traffic. "
-                "Use gsc_performance_trend to see daily aggregate data."
-            )
+    queries = queries_result.get("rows", [])
+    pages = pages_result.get("rows", [])
+    if not queries and not pages:
+        return (
+            f"No query or page data found for {site_url}.\n"
+            "The site may have no search traffic or data may not be available yet. "
+            "Use gsc_performance_trend to see daily aggregate data."
+        )
 
-        rows_sorted = sorted(rows, key=lambda r: r.get("clicks", 0), reverse=True)
-        if limit > 0:
-            rows_sorted = rows_sorted[:limit]
+    # Same ordering as gsc_top_queries / gsc_top_pages
+    top_queries = _top_rows(queries, limit, _by_clicks_impressions)
+    top_pages = _top_rows(pages, limit)
 
-        return json.dumps({
-            "site": site_url,
-            "search_type": search_type,
-            "top_pages": rows_sorted,
-            "total_shown": len(rows_sorted),
-            "total_available": len(rows),
-        }, indent=2)
+    return _to_json({
+        "site": site_url,
+        "search_type": search_type,
+        "top_queries": top_queries,
+        "total_queries_available": len(queries),
+        "top_pages": top_pages,
+        "total_pages_available": len(pages),
+    })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_top_pages")
-        return f"❌ Unexpected error: {e}"
 
+# Dimensions gsc_search_analytics can group by
+_SA_DIMENSIONS = ("query", "page", "country", "device")
 
-@mcp.tool()
+
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def gsc_search_analytics(
     site_url: str,
     dimension: str = "query",
@@ -320,46 +488,39 @@ async def gsc_search_analytics(
         start_date: Optional start date in YYYY-MM-DD format
         end_date: Optional end date in YYYY-MM-DD format
     """
-    valid_dims = ["query", "page", "country", "device"]
     dim = dimension.lower().strip()
-    if dim not in valid_dims:
-        return f"❌ Invalid dimension '{dimension}'. Valid options: {valid_dims}"
-
-    try:
-        result = await gsc_client.query_search_analytics(
-            site_url=site_url,
-            dimensions=[dim],
-            search_type=search_type,
-            start_date=start_date or None,
-            end_date=end_date or None,
+    if dim not in _SA_DIMENSIONS:
+        return f"❌ Invalid dimension '{dimension}'. Valid options: {list(_SA_DIMENSIONS)}"
+
+    result = await gsc_client.query_search_analytics(
+        site_url=site_url,
+        dimensions=[dim],
+        search_type=search_type,
+        start_date=start_date or None,
+        end_date=end_date or None,
+    )
+
+    rows = result.get("rows", [])
+    if not rows:
+        note = result.get("note", "")
+        return (
+            f"No data found for {site_url} with dimension={dim}. {note}\n"
+            "Use gsc_performance_trend to see daily aggregate traffic data."
         )
 
-        rows = result.get("rows", [])
-        if not rows:
-            note = result.get("note", "")
-            return (
-                f"No data found for {site_url} with dimension={dim}. {note}\n"
-                "Use gsc_performance_trend to see daily aggregate traffic data."
-            )
-
-        rows_sorted = sorted(rows, key=lambda r: r.get("clicks", 0), reverse=True)[:100]
-
-        return json.dumps({
-            "site": site_url,
-            "dimension": dim,
-            "search_type": search_type,
-            "data": rows_sorted,
-            "total_rows": len(rows_sorted),
-        }, indent=2)
+    rows_sorted = _top_rows(rows, 100)
 
-    except (ValueError, RuntimeError) as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_search_analytics")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "dimension": dim,
+        "search_type": search_type,
+        "data": rows_sorted,
+        "total_rows": len(rows_sorted),
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_site_summary(site_url: str) -> str:
     """
     Get a coverage and indexing summary for a GSC property.
@@ -370,62 +531,56 @@ async def gsc_site_summary(site_url: str) -> str:
     Args:
         site_url: The verified property URL (e.g., "https://example.com/")
     """
-    try:
-        summary = await gsc_client.get_site_summary(site_url)
-        raw = summary.get("data")
-
-        if raw is None:
-            return f"No summary data available for {site_url}."
-
-        # Parse the gydQ5d response structure:
-        # [[[count, [count, warnings, errors]], ...], False, 0, "site_url"]
-        coverage_items = []
-        if isinstance(raw, list) and len(raw) >= 1 and isinstance(raw[0], list):
-            for item in raw[0]:
-                if isinstance(item, list) and len(item) >= 2:
-                    total = item[0]
-                    details = item[1] if isinstance(item[1], list) else [item[1]]
-                    valid = details[0] if len(details) > 0 else 0
-                    warnings = details[1] if len(details) > 1 else 0
-                    errors = details[2] if len(details) > 2 else 0
-                    coverage_items.append({
-                        "total_urls": total,
-                        "valid": valid,
-                        "warnings": warnings,
-                        "errors": errors,
-                    })
-
-        if coverage_items:
-            # Summarize across all coverage categories
-            total_valid = sum(c["valid"] for c in coverage_items)
-            total_warnings = sum(c["warnings"] for c in coverage_items)
-            total_errors = sum(c["errors"] for c in coverage_items)
-
-            return json.dumps({
-                "site": site_url,
-                "coverage_summary": {
-                    "total_valid_pages": total_valid,
-                    "total_warnings": total_warnings,
-                    "total_errors": total_errors,
-                    "coverage_categories": len(coverage_items),
-                },
-                "coverage_breakdown": coverage_items,
-                "raw_data": str(raw)[:500],
-            }, indent=2)
-
-        return json.dumps({
+    summary = await gsc_client.get_site_summary(site_url)
+    raw = summary.get("data")
+
+    if raw is None:
+        return f"No summary data available for {site_url}."
+
+    # Parse the gydQ5d response structure:
+    # [[[count, [count, warnings, errors]], ...], False, 0, "site_url"]
+    # Totals across all coverage categories are summed while parsing
+    coverage_items = []
+    total_valid = total_warnings = total_errors = 0
+    if isinstance(raw, list) and len(raw) >= 1 and isinstance(raw[0], list):
+        for item in raw[0]:
+            if isinstance(item, list) and len(item) >= 2:
+                total = item[0]
+                details = item[1] if isinstance(item[1], list) else [item[1]]
+                valid = details[0] if len(details) > 0 else 0
+                warnings = details[1] if len(details) > 1 else 0
+                errors = details[2] if len(details) > 2 else 0
+                coverage_items.append({
+                    "total_urls": total,
+                    "valid": valid,
+                    "warnings": warnings,
+                    "errors": errors,
+                })
+                total_valid += valid
+                total_warnings += warnings
+                total_errors += errors
+
+    if coverage_items:
+        return _to_json({
             "site": site_url,
-            "data": str(raw)[:800],
-        }, indent=2)
+            "coverage_summary": {
+                "total_valid_pages": total_valid,
+                "total_warnings": total_warnings,
+                "total_errors": total_errors,
+                "coverage_categories": len(coverage_items),
+            },
+            "coverage_breakdown": coverage_items,
+            "raw_data": _preview(raw, 500),
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_site_summary")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "data": _preview(raw, 800),
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_list_sitemaps(site_url: str) -> str:
     """
     List all submitted sitemaps for a GSC property.
@@ -435,33 +590,37 @@ async def gsc_list_sitemaps(site_url: str) -> str:
     Args:
         site_url: The verified property URL (e.g., "https://example.com/")
     """
-    try:
-        result = await gsc_client.get_sitemaps(site_url)
-
-        sitemaps = result.get("sitemaps", [])
-        submitted = result.get("submitted")
-        indexed = result.get("indexed")
-        errors = result.get("errors")
-
-        return json.dumps({
-            "site": site_url,
-            "stats": {
-                "submitted": submitted,
-                "indexed": indexed,
-                "errors": errors,
-            },
-            "sitemaps": sitemaps,
-            "total": len(sitemaps),
-        }, indent=2)
-
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_list_sitemaps")
-        return f"❌ Unexpected error: {e}"
-
-
-@mcp.tool()
+    result = await gsc_client.get_sitemaps(site_url)
+
+    sitemaps = result.get("sitemaps", [])
+    submitted = result.get("submitted")
+    indexed = result.get("indexed")
+    errors = result.get("errors")
+
+    return _to_json({
+        "site": site_url,
+        "stats": {
+            "submitted": submitted,
+            "indexed": indexed,
+            "errors": errors,
+        },
+        "sitemaps": sitemaps,
+        "total": len(sitemaps),
+    })
+
+
+# Human-readable labels for GSC insight callout types
+_CALLOUT_LABELS = {
+    "@BRANDED-CALLOUT@": "Branded query trend",
+    "@INSIGHTS-SAN-FILTERED-BY-PAGE-CALLOUT@": "Data filtered by page",
+    "@INSIGHTS-SAN-FILTERED-BY-QUERY-CALLOUT@": "Data filtered by query",
+    "@INSIGHTS-SAN-FILTERED-BY-COUNTRY-CALLOUT@": "Data filtered by country",
+    "@INSIGHTS-SAN-FILTERED-BY-SEARCH-TYPE-CALLOUT@": "Data filtered by search type",
+}
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_insights(site_url: str) -> str:
     """
     Get Search Console Insights and notifications for a GSC property.
@@ -472,52 +631,37 @@ async def gsc_insights(site_url: str) -> str:
     Args:
         site_url: The verified property URL (e.g., "https://example.com/")
     """
-    try:
-        result = await gsc_client.get_insights(site_url)
-
-        callouts = result.get("callouts", [])
-
-        if not callouts:
-            return json.dumps({
-                "site": site_url,
-                "message": "No insights or notifications found for this property.",
-                "callouts": [],
-            }, indent=2)
-
-        # Make callout types human-readable
-        type_labels = {
-            "@BRANDED-CALLOUT@": "Branded query trend",
-            "@INSIGHTS-SAN-FILTERED-BY-PAGE-CALLOUT@": "Data filtered by page",
-            "@INSIGHTS-SAN-FILTERED-BY-QUERY-CALLOUT@": "Data filtered by query",
-            "@INSIGHTS-SAN-FILTERED-BY-COUNTRY-CALLOUT@": "Data filtered by country",
-            "@INSIGHTS-SAN-FILTERED-BY-SEARCH-TYPE-CALLOUT@": "Data filtered by search type",
-        }
-
-        formatted = []
-        for c in callouts:
-            callout_type = c.get("type", "")
-            formatted.append({
-                "type": callout_type,
-                "label": type_labels.get(callout_type, callout_type),
-                "priority": c.get("priority"),
-                "date": c.get("date"),
-                "counts": c.get("counts"),
-            })
-
-        return json.dumps({
-            "site": site_url,
-            "insights_count": len(formatted),
-            "insights": formatted,
-        }, indent=2)
-
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_insights")
-        return f"❌ Unexpected error: {e}"
+    result = await gsc_client.get_insights(site_url)
 
+    callouts = result.get("callouts", [])
 
-@mcp.tool()
+    if not callouts:
+        return _to_json({
+            "site": site_url,
+            "message": "No insights or notifications found for this property.",
+            "callouts": [],
+        })
+
+    formatted = []
+    for c in callouts:
+        callout_type = c.get("type", "")
+        formatted.append({
+            "type": callout_type,
+            "label": _CALLOUT_LABELS.get(callout_type, callout_type),
+            "priority": c.get("priority"),
+            "date": c.get("date"),
+            "counts": c.get("counts"),
+        })
+
+    return _to_json({
+        "site": site_url,
+        "insights_count": len(formatted),
+        "insights": formatted,
+    })
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_all_queries(
     site_url: str,
     search_type: str = "WEB",
@@ -531,42 +675,34 @@ async def gsc_all_queries(
         site_url: The verified property URL (e.g., "https://example.com/")
         search_type: "WEB" (default), "IMAGE", "VIDEO", "NEWS"
     """
-    try:
-        result = await gsc_client.scrape_all_queries_from_html(
-            site_url=site_url,
-            search_type=search_type,
-        )
+    result = await gsc_client.scrape_all_queries_from_html(
+        site_url=site_url,
+        search_type=search_type,
+    )
 
-        rows = result.get("rows", [])
-        if not rows:
-            return (
-                f"No queries extracted from HTML for {site_url}.\n"
-                "The site may have no search traffic, or the HTML structure may have changed. "
-                "Try gsc_top_queries as a fallback."
-            )
-
-        rows_sorted = sorted(
-            rows,
-            key=lambda r: (r.get("clicks", 0), r.get("impressions", 0)),
-            reverse=True,
+    rows = result.get("rows", [])
+    if not rows:
+        return (
+            f"No queries extracted from HTML for {site_url}.\n"
+            "The site may have no search traffic, or the HTML structure may have changed. "
+            "Try gsc_top_queries as a fallback."
         )
 
-        return json.dumps({
+    def finish() -> str:
+        rows_sorted = sorted(rows, key=_by_clicks_impressions, reverse=True)
+        return _to_json({
             "site": site_url,
             "search_type": search_type,
             "queries": rows_sorted,
             "total": len(rows_sorted),
             "source": "html_scraping",
-        }, indent=2)
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_all_queries")
-        return f"❌ Unexpected error: {e}"
+    return await _finish_off_loop(len(rows), finish)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_index_coverage(site_url: str) -> str:
     """
     Get detailed index coverage statistics for a GSC property.
@@ -577,59 +713,53 @@ async def gsc_index_coverage(site_url: str) -> str:
     Args:
         site_url: The verified property URL (e.g., "https://example.com/")
     """
-    try:
-        result = await gsc_client.get_coverage_stats(site_url)
-        raw = result.get("raw")
-
-        if raw is None:
-            return f"No index coverage data available for {site_url}."
-
-        coverage_items = []
-        if isinstance(raw, list):
-            items_to_iterate = raw if not raw or not isinstance(raw[0], list) else raw[0]
-            for item in items_to_iterate:
-                if isinstance(item, list) and len(item) >= 2:
-                    total = item[0] if isinstance(item[0], (int, float)) else 0
-                    details = item[1] if isinstance(item[1], list) else [item[1]]
-                    valid = details[0] if len(details) > 0 and isinstance(details[0], (int, float)) else 0
-                    warnings = details[1] if len(details) > 1 and isinstance(details[1], (int, float)) else 0
-                    errors = details[2] if len(details) > 2 and isinstance(details[2], (int, float)) else 0
-                    coverage_items.append({
-                        "total_urls": total,
-                        "valid": valid,
-                        "warnings": warnings,
-                        "errors": errors,
-                    })
-
-        if coverage_items:
-            total_valid = sum(c["valid"] for c in coverage_items)
-            total_warnings = sum(c["warnings"] for c in coverage_items)
-            total_errors = sum(c["errors"] for c in coverage_items)
-
-            return json.dumps({
-                "site": site_url,
-                "coverage_summary": {
-                    "total_valid_pages": total_valid,
-                    "total_warnings": total_warnings,
-                    "total_errors": total_errors,
-                    "categories": len(coverage_items),
-                },
-                "coverage_breakdown": coverage_items,
-            }, indent=2)
-
-        return json.dumps({
+    result = await gsc_client.get_coverage_stats(site_url)
+    raw = result.get("raw")
+
+    if raw is None:
+        return f"No index coverage data available for {site_url}."
+
+    coverage_items = []
+    total_valid = total_warnings = total_errors = 0
+    if isinstance(raw, list):
+        items_to_iterate = raw if not raw or not isinstance(raw[0], list) else raw[0]
+        for item in items_to_iterate:
+            if isinstance(item, list) and len(item) >= 2:
+                total = item[0] if isinstance(item[0], (int, float)) else 0
+                details = item[1] if isinstance(item[1], list) else [item[1]]
+                valid = details[0] if len(details) > 0 and isinstance(details[0], (int, float)) else 0
+                warnings = details[1] if len(details) > 1 and isinstance(details[1], (int, float)) else 0
+                errors = details[2] if len(details) > 2 and isinstance(details[2], (int, float)) else 0
+                coverage_items.append({
+                    "total_urls": total,
+                    "valid": valid,
+                    "warnings": warnings,
+                    "errors": errors,
+                })
+                total_valid += valid
+                total_warnings += warnings
+                total_errors += errors
+
+    if coverage_items:
+        return _to_json({
             "site": site_url,
-            "raw_data": str(raw)[:800],
-        }, indent=2)
+            "coverage_summary": {
+                "total_valid_pages": total_valid,
+                "total_warnings": total_warnings,
+                "total_errors": total_errors,
+                "categories": len(coverage_items),
+            },
+            "coverage_breakdown": coverage_items,
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_index_coverage")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "raw_data": _preview(raw, 800),
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def gsc_query_pages(
     site_url: str,
     search_type: str = "WEB",
@@ -646,47 +776,103 @@ async def gsc_query_pages(
         search_type: "WEB" (default), "IMAGE", "VIDEO", "NEWS"
         limit: Max rows to return (default 50, use 0 for all)
     """
-    try:
-        result = await gsc_client.query_search_analytics(
-            site_url=site_url,
-            dimensions=["query", "page"],
-            search_type=search_type,
-        )
-
-        rows = result.get("rows", [])
-        if not rows:
-            return (
-                f"No query-page data found for {site_url}.\n"
-                "The site may have insufficient traffic for multi-dimension breakdowns."
-            )
-
-        rows_sorted = sorted(
-            rows,
-            key=lambda r: (r.get("clicks", 0), r.get("impressions", 0)),
-            reverse=True,
+    result = await gsc_client.query_search_analytics(
+        site_url=site_url,
+        dimensions=["query", "page"],
+        search_type=search_type,
+    )
+
+    rows = result.get("rows", [])
+    if not rows:
+        return (
+            f"No query-page data found for {site_url}.\n"
+            "The site may have insufficient traffic for multi-dimension breakdowns."
         )
 
-        if limit > 0:
-            rows_sorted = rows_sorted[:limit]
-
-        return json.dumps({
+    def finish() -> str:
+        rows_sorted = _top_rows(rows, limit, _by_clicks_impressions)
+        return _to_json({
             "site": site_url,
             "search_type": search_type,
             "query_pages": rows_sorted,
             "total_shown": len(rows_sorted),
             "total_available": len(rows),
-        }, indent=2)
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in gsc_query_pages")
-        return f"❌ Unexpected error: {e}"
+    return await _finish_off_loop(len(rows), finish)
 
 
 # ─── Bing Tools ───────────────────────────────────────────────────────────────
 
-@mcp.tool()
+# Output fields of the Bing row tools: (output key, Bing key, default).
+# Bing sends PascalCase keys; some responses use camelCase instead.
+_BING_TRAFFIC_FIELDS = (
+    ("date", "Date", ""),
+    ("impressions", "Impressions", 0),
+    ("clicks", "Clicks", 0),
+    ("avgClickPosition", "AvgClickPosition", 0),
+)
+_BING_KEYWORD_FIELDS = (("query", "Query", ""),) + _BING_TRAFFIC_FIELDS[1:]
+_BING_PAGE_FIELDS = (("url", "Url", ""),) + _BING_TRAFFIC_FIELDS[1:]
+_BING_CRAWL_FIELDS = (
+    ("crawledPages", "CrawledPages", 0),
+    ("inIndex", "InIndex", 0),
+    ("crawlErrors", "CrawlErrors", 0),
+    ("dnsErrors", "DnsErrors", 0),
+    ("connectionTimeouts", "ConnectionTimeouts", 0),
+    ("robotsExcluded", "RobotsExcluded", 0),
+    ("httpErrors", "HttpErrors", 0),
+)
+_BING_URL_INFO_FIELDS = (
+    ("crawlDate", "CrawlDate", ""),
+    ("httpStatusCode", "HttpStatusCode", 0),
+    ("isIndexed", "IsIndexed", False),
+    ("lastCrawled", "LastCrawled", ""),
+)
+_BING_ISSUE_FIELDS = (
+    ("url", "Url", ""),
+    ("issueCode", "IssueCode", ""),
+    ("severity", "Severity", ""),
+    ("lastCrawled", "LastCrawled", ""),
+    ("httpCode", "HttpCode", 0),
+)
+_BING_QUOTA_FIELDS = (
+    ("dailyQuota", "DailyQuota", 0),
+    ("monthlyQuota", "MonthlyQuota", 0),
+)
+# Optional bing_url_info fields, passed through only when Bing sends them:
+# (PascalCase key, camelCase key)
+_BING_URL_INFO_EXTRAS = tuple(
+    (key, key[0].lower() + key[1:])
+    for key in ("InLinks", "InternalLinks", "FetchedDate", "DiscoveredDate")
+)
+
+# Largest page size the Bing row endpoints accept
+_BING_MAX_PAGE_ROWS = 500
+
+
+def _bing_key(sample: dict, key: str) -> str:
+    """`key` as spelled in `sample`: PascalCase if present, else camelCase."""
+    return key if key in sample else key[0].lower() + key[1:]
+
+
+def _format_bing_rows(rows: list[dict], fields: tuple) -> list[dict]:
+    """
+    Map Bing rows to output dicts using `fields`.
+
+    The key casing is picked once from the first row (every row of a
+    response uses the same casing), so each field costs one lookup per
+    row instead of a PascalCase-then-camelCase pair.
+    """
+    if not rows:
+        return []
+    sample = rows[0]
+    spec = [(out, _bing_key(sample, key), default) for out, key, default in fields]
+    return [{out: row.get(key, default) for out, key, default in spec} for row in rows]
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_list_sites() -> str:
     """
     List all sites/properties in your Bing Webmaster Tools account.
@@ -696,29 +882,23 @@ async def bing_list_sites() -> str:
 
     No parameters required.
     """
-    try:
-        sites = await bing_client.get_user_sites()
-
-        if not sites:
-            return (
-                "No sites found in your Bing Webmaster Tools account. "
-                "Add and verify sites at bing.com/webmasters"
-            )
+    sites = await bing_client.get_user_sites()
 
-        result = [
-            {"url": site.get("Url") or site.get("url", "")}
-            for site in sites
-        ]
-        return json.dumps(result, indent=2)
+    if not sites:
+        return (
+            "No sites found in your Bing Webmaster Tools account. "
+            "Add and verify sites at bing.com/webmasters"
+        )
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_list_sites")
-        return f"❌ Unexpected error: {e}"
+    result = [
+        {"url": site.get("Url") or site.get("url", "")}
+        for site in sites
+    ]
+    return _to_json(result)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def bing_search_analytics(
     site_url: str,
     start_date: str,
@@ -737,41 +917,28 @@ async def bing_search_analytics(
         end_date: End date in YYYY-MM-DD format
         limit: Maximum number of rows to return (default 100)
     """
-    try:
-        rows = await bing_client.get_search_analytics(
-            site_url=site_url,
-            start_date=start_date,
-            end_date=end_date,
-            max_count=min(limit, 500),
-        )
-
-        if not rows:
-            return f"No Bing search analytics found for {site_url} in the selected date range."
+    rows = await bing_client.get_search_analytics(
+        site_url=site_url,
+        start_date=start_date,
+        end_date=end_date,
+        max_count=min(limit, _BING_MAX_PAGE_ROWS),
+    )
 
-        formatted = []
-        for row in rows:
-            formatted.append({
-                "date": row.get("Date", row.get("date", "")),
-                "impressions": row.get("Impressions", row.get("impressions", 0)),
-                "clicks": row.get("Clicks", row.get("clicks", 0)),
-                "avgClickPosition": row.get("AvgClickPosition", row.get("avgClickPosition", 0)),
-            })
+    if not rows:
+        return f"No Bing search analytics found for {site_url} in the selected date range."
 
-        return json.dumps({
-            "site": site_url,
-            "period": f"{start_date} to {end_date}",
-            "data": formatted,
-            "total_rows": len(formatted),
-        }, indent=2)
+    formatted = _format_bing_rows(rows, _BING_TRAFFIC_FIELDS)
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_search_analytics")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "period": f"{start_date} to {end_date}",
+        "data": formatted,
+        "total_rows": len(formatted),
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_crawl_stats(site_url: str) -> str:
     """
     Get crawl statistics for a site in Bing Webmaster Tools.
@@ -783,39 +950,24 @@ async def bing_crawl_stats(site_url: str) -> str:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
     """
-    try:
-        stats = await bing_client.get_crawl_stats(site_url)
-
-        if not stats:
-            return f"No crawl stats found for {site_url}."
+    stats = await bing_client.get_crawl_stats(site_url)
 
-        # Handle case where Bing returns a list instead of dict
-        if isinstance(stats, list):
-            if len(stats) == 0:
-                return f"No crawl stats found for {site_url}."
-            stats = stats[0]  # Take first item
+    if not stats:
+        return f"No crawl stats found for {site_url}."
 
-        result = {
-            "site": site_url,
-            "crawledPages": stats.get("CrawledPages", stats.get("crawledPages", 0)),
-            "inIndex": stats.get("InIndex", stats.get("inIndex", 0)),
-            "crawlErrors": stats.get("CrawlErrors", stats.get("crawlErrors", 0)),
-            "dnsErrors": stats.get("DnsErrors", stats.get("dnsErrors", 0)),
-            "connectionTimeouts": stats.get("ConnectionTimeouts", stats.get("connectionTimeouts", 0)),
-            "robotsExcluded": stats.get("RobotsExcluded", stats.get("robotsExcluded", 0)),
-            "httpErrors": stats.get("HttpErrors", stats.get("httpErrors", 0)),
-        }
+    # Handle case where Bing returns a list instead of dict
+    if isinstance(stats, list):
+        if len(stats) == 0:
+            return f"No crawl stats found for {site_url}."
+        stats = stats[0]  # Take first item
 
-        return json.dumps(result, indent=2)
+    result = {"site": site_url, **_format_bing_rows([stats], _BING_CRAWL_FIELDS)[0]}
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_crawl_stats")
-        return f"❌ Unexpected error: {e}"
+    return _to_json(result)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(ValueError, RuntimeError)
 async def bing_keyword_stats(
     site_url: str,
     start_date: str,
@@ -833,45 +985,33 @@ async def bing_keyword_stats(
                   (e.g., "https://example.com/")
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
-        limit: Maximum number of keywords to return (default 100)
+        limit: Maximum number of keywords to return (default 100, use 0 for
+               all; negative values are treated as 0)
     """
-    try:
-        rows = await bing_client.get_keyword_stats(
-            site_url=site_url,
-            start_date=start_date,
-            end_date=end_date,
-            max_count=min(limit, 500),
-        )
-
-        if not rows:
-            return f"No keyword data found for {site_url} in the selected date range."
-
-        formatted = []
-        for row in rows:
-            formatted.append({
-                "query": row.get("Query", row.get("query", "")),
-                "impressions": row.get("Impressions", row.get("impressions", 0)),
-                "clicks": row.get("Clicks", row.get("clicks", 0)),
-                "avgClickPosition": row.get("AvgClickPosition", row.get("avgClickPosition", 0)),
-            })
-
-        formatted.sort(key=lambda x: x.get("clicks", 0), reverse=True)
-
-        return json.dumps({
-            "site": site_url,
-            "period": f"{start_date} to {end_date}",
-            "keywords": formatted,
-            "total": len(formatted),
-        }, indent=2)
-
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_keyword_stats")
-        return f"❌ Unexpected error: {e}"
-
-
-@mcp.tool()
+    limit = max(limit, 0)
+    rows = await bing_client.get_keyword_stats(
+        site_url=site_url,
+        start_date=start_date,
+        end_date=end_date,
+        # "all" is as much as one Bing page holds
+        max_count=min(limit or _BING_MAX_PAGE_ROWS, _BING_MAX_PAGE_ROWS),
+    )
+
+    if not rows:
+        return f"No keyword data found for {site_url} in the selected date range."
+
+    formatted = _top_rows(_format_bing_rows(rows, _BING_KEYWORD_FIELDS), limit)
+
+    return _to_json({
+        "site": site_url,
+        "period": f"{start_date} to {end_date}",
+        "keywords": formatted,
+        "total": len(formatted),
+    })
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_url_info(
     site_url: str,
     page_url: str,
@@ -887,36 +1027,30 @@ async def bing_url_info(
         page_url: The specific page URL to inspect
                   (e.g., "https://example.com/about")
     """
-    try:
-        info = await bing_client.get_url_info(site_url=site_url, page_url=page_url)
-
-        if not info:
-            return f"No URL info found for {page_url} in Bing."
+    info = await bing_client.get_url_info(site_url=site_url, page_url=page_url)
 
-        result = {
-            "site": site_url,
-            "url": page_url,
-            "crawlDate": info.get("CrawlDate", info.get("crawlDate", "")),
-            "httpStatusCode": info.get("HttpStatusCode", info.get("httpStatusCode", 0)),
-            "isIndexed": info.get("IsIndexed", info.get("isIndexed", False)),
-            "lastCrawled": info.get("LastCrawled", info.get("lastCrawled", "")),
-        }
+    if not info:
+        return f"No URL info found for {page_url} in Bing."
 
-        for key in ("InLinks", "InternalLinks", "FetchedDate", "DiscoveredDate"):
-            val = info.get(key) or info.get(key[0].lower() + key[1:])
-            if val is not None:
-                result[key] = val
+    result = {
+        "site": site_url,
+        "url": page_url,
+        **_format_bing_rows([info], _BING_URL_INFO_FIELDS)[0],
+    }
 
-        return json.dumps(result, indent=2)
+    for key, camel_key in _BING_URL_INFO_EXTRAS:
+        val = info.get(key)
+        if val is None:
+            # `is None`, not `or`: InLinks=0 is a real value
+            val = info.get(camel_key)
+        if val is not None:
+            result[key] = val
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_url_info")
-        return f"❌ Unexpected error: {e}"
+    return _to_json(result)
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_page_stats(
     site_url: str,
     limit: int = 100,
@@ -929,40 +1063,30 @@ async def bing_page_stats(
     Args:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
-        limit: Maximum number of pages to return (default 100)
+        limit: Maximum number of pages to return (default 100, use 0 for
+               all; negative values are treated as 0)
     """
-    try:
-        rows = await bing_client.get_page_stats(site_url=site_url)
-
-        if not rows:
-            return f"No page stats found for {site_url} in Bing."
-
-        formatted = []
-        for row in rows:
-            formatted.append({
-                "url": row.get("Url", row.get("url", "")),
-                "impressions": row.get("Impressions", row.get("impressions", 0)),
-                "clicks": row.get("Clicks", row.get("clicks", 0)),
-                "avgClickPosition": row.get("AvgClickPosition", row.get("avgClickPosition", 0)),
-            })
+    limit = max(limit, 0)
+    rows = await bing_client.get_page_stats(site_url=site_url)
 
-        formatted.sort(key=lambda x: x.get("clicks", 0), reverse=True)
-        formatted = formatted[:limit]
+    if not rows:
+        return f"No page stats found for {site_url} in Bing."
 
-        return json.dumps({
-            "site": site_url,
-            "pages": formatted,
-            "total": len(formatted),
-        }, indent=2)
+    # Rank the raw rows and format only the ones returned, rather than
+    # building an output dict for every page and discarding most of them
+    clicks = _bing_key(rows[0], "Clicks")
+    top = _top_rows(rows, limit, key=lambda row: row.get(clicks, 0))
+    formatted = _format_bing_rows(top, _BING_PAGE_FIELDS)
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_page_stats")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "pages": formatted,
+        "total": len(formatted),
+    })
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_submit_url(
     site_url: str,
     url: str,
@@ -979,26 +1103,24 @@ async def bing_submit_url(
         url: The page URL to submit for indexing
              (e.g., "https://example.com/new-page")
     """
-    try:
-        await bing_client.submit_url(site_url=site_url, url=url)
-        return json.dumps({
-            "status": "submitted",
-            "site": site_url,
-            "url": url,
-            "message": f"URL {url} has been submitted to Bing for indexing.",
-        }, indent=2)
+    await bing_client.submit_url(site_url=site_url, url=url)
+    return _to_json({
+        "status": "submitted",
+        "site": site_url,
+        "url": url,
+        "message": f"URL {url} has been submitted to Bing for indexing.",
+    })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_submit_url")
-        return f"❌ Unexpected error: {e}"
+
+# Separators accepted in a string `urls` argument: commas and/or whitespace
+_URL_LIST_SEP = re.compile(r"[,\s]+")
 
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_submit_url_batch(
     site_url: str,
-    urls: str,
+    urls: list[str] | str,
 ) -> str:
     """
     Submit multiple URLs to Bing for indexing in a single batch.
@@ -1009,31 +1131,56 @@ async def bing_submit_url_batch(
     Args:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
-        urls: Comma-separated list of page URLs to submit
-              (e.g., "https://example.com/page1,https://example.com/page2")
+        urls: List of page URLs to submit, or one string of comma- or
+              whitespace-separated URLs
+              (e.g., "https://example.com/page1,https://example.com/page2").
+              Duplicates are submitted once. Lists longer than one Bing
+              batch are sent as several batches in parallel.
     """
-    try:
-        url_list = [u.strip() for u in urls.split(",") if u.strip()]
-        if not url_list:
-            return "❌ No valid URLs provided. Pass comma-separated URLs."
-
+    if isinstance(urls, str):
+        url_list = _URL_LIST_SEP.split(urls)
+    else:
+        url_list = [u.strip() for u in urls]
+    url_list = [u for u in dict.fromkeys(url_list) if u]
+    if not url_list:
+        return "❌ No valid URLs provided. Pass a list or comma-separated URLs."
+
+    size = bing_client.SUBMIT_BATCH_MAX
+    chunks = [url_list[i:i + size] for i in range(0, len(url_list), size)]
+    if len(chunks) == 1:
         await bing_client.submit_url_batch(site_url=site_url, urls=url_list)
-        return json.dumps({
-            "status": "submitted",
-            "site": site_url,
-            "urls_submitted": url_list,
-            "count": len(url_list),
-            "message": f"{len(url_list)} URLs submitted to Bing for indexing.",
-        }, indent=2)
-
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_submit_url_batch")
-        return f"❌ Unexpected error: {e}"
-
+        results = [None]
+    else:
+        results = await asyncio.gather(
+            *(bing_client.submit_url_batch(site_url=site_url, urls=c) for c in chunks),
+            return_exceptions=True,
+        )
 
-@mcp.tool()
+    submitted: list[str] = []
+    failed: list[dict] = []
+    for chunk, res in zip(chunks, results):
+        if isinstance(res, Exception):
+            failed.append({"urls": chunk, "error": str(res)})
+        else:
+            submitted.extend(chunk)
+    if not submitted:
+        raise results[0]
+
+    response = {
+        "status": "submitted" if not failed else "partial",
+        "site": site_url,
+        "urls_submitted": submitted,
+        "count": len(submitted),
+        "message": f"{len(submitted)} URLs submitted to Bing for indexing.",
+    }
+    if failed:
+        response["failed"] = failed
+        response["failed_count"] = sum(len(f["urls"]) for f in failed)
+    return _to_json(response)
+
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_crawl_issues(site_url: str) -> str:
     """
     Get crawl issues and errors for a site from Bing Webmaster Tools.
@@ -1045,41 +1192,27 @@ async def bing_crawl_issues(site_url: str) -> str:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
     """
-    try:
-        issues = await bing_client.get_crawl_issues(site_url=site_url)
-
-        if not issues:
-            return json.dumps({
-                "site": site_url,
-                "message": "No crawl issues found — your site is healthy!",
-                "issues": [],
-                "total": 0,
-            }, indent=2)
-
-        formatted = []
-        for issue in issues:
-            formatted.append({
-                "url": issue.get("Url", issue.get("url", "")),
-                "issueCode": issue.get("IssueCode", issue.get("issueCode", "")),
-                "severity": issue.get("Severity", issue.get("severity", "")),
-                "lastCrawled": issue.get("LastCrawled", issue.get("lastCrawled", "")),
-                "httpCode": issue.get("HttpCode", issue.get("httpCode", 0)),
-            })
+    issues = await bing_client.get_crawl_issues(site_url=site_url)
 
-        return json.dumps({
+    if not issues:
+        return _to_json({
             "site": site_url,
-            "issues": formatted,
-            "total": len(formatted),
-        }, indent=2)
+            "message": "No crawl issues found — your site is healthy!",
+            "issues": [],
+            "total": 0,
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_crawl_issues")
-        return f"❌ Unexpected error: {e}"
+    formatted = _format_bing_rows(issues, _BING_ISSUE_FIELDS)
 
+    return _to_json({
+        "site": site_url,
+        "issues": formatted,
+        "total": len(formatted),
+    })
 
-@mcp.tool()
+
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_url_submission_quota(site_url: str) -> str:
     """
     Check your daily URL submission quota in Bing Webmaster Tools.
@@ -1090,26 +1223,16 @@ async def bing_url_submission_quota(site_url: str) -> str:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
     """
-    try:
-        quota = await bing_client.get_url_submission_quota(site_url=site_url)
+    quota = await bing_client.get_url_submission_quota(site_url=site_url)
 
-        if not quota:
-            return f"No quota information available for {site_url}."
+    if not quota:
+        return f"No quota information available for {site_url}."
 
-        return json.dumps({
-            "site": site_url,
-            "dailyQuota": quota.get("DailyQuota", quota.get("dailyQuota", 0)),
-            "monthlyQuota": quota.get("MonthlyQuota", quota.get("monthlyQuota", 0)),
-        }, indent=2)
+    return _to_json({"site": site_url, **_format_bing_rows([quota], _BING_QUOTA_FIELDS)[0]})
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_url_submission_quota")
-        return f"❌ Unexpected error: {e}"
 
-
-@mcp.tool()
+@mcp.tool(structured_output=False)
+@_tool_errors(RuntimeError)
 async def bing_link_counts(site_url: str) -> str:
     """
     Get inbound link counts for a site from Bing Webmaster Tools.
@@ -1120,53 +1243,47 @@ async def bing_link_counts(site_url: str) -> str:
         site_url: The site URL as it appears in Bing Webmaster Tools
                   (e.g., "https://example.com/")
     """
-    try:
-        data = await bing_client.get_link_counts(site_url=site_url)
+    data = await bing_client.get_link_counts(site_url=site_url)
 
-        if not data:
-            return f"No link data found for {site_url} in Bing."
+    if not data:
+        return f"No link data found for {site_url} in Bing."
 
-        if isinstance(data, list):
-            return json.dumps({
-                "site": site_url,
-                "links": data,
-                "total_entries": len(data),
-            }, indent=2)
-
-        return json.dumps({
+    if isinstance(data, list):
+        return _to_json({
             "site": site_url,
-            "linkData": data,
-        }, indent=2)
+            "links": data,
+            "total_entries": len(data),
+        })
 
-    except RuntimeError as e:
-        return f"❌ Error: {e}"
-    except Exception as e:
-        logger.exception("Unexpected error in bing_link_counts")
-        return f"❌ Unexpected error: {e}"
+    return _to_json({
+        "site": site_url,
+        "linkData": data,
+    })
 
 
 # ─── Utility Tools ────────────────────────────────────────────────────────────
 
-@mcp.tool()
+@mcp.tool(structured_output=False)
 async def refresh_google_session() -> str:
     """
     Force refresh the cached Google Chrome cookies.
 
     Use this if you've recently logged back in to Google in Chrome
     and GSC tools are still showing authentication errors.
-    Also clears the cached XSRF token.
+    Also clears the cached XSRF token, GSC site list and scraped pages.
 
     No parameters required.
     """
     try:
         clear_cookie_cache()
-        # Clear XSRF cache too
-        from .clients.gsc_client import _xsrf_cache
-        _xsrf_cache["token"] = None
-        _xsrf_cache["expires"] = 0.0
-
-        from .extractors.chrome_cookies import get_google_cookies
-        cookies = get_google_cookies(force_refresh=True)
+        # Clear XSRF cache too (in memory and on disk)
+        gsc_client.clear_xsrf_token()
+        # Responses fetched with the old session may belong to another account
+        gsc_client.clear_caches()
+
+        # Reading the browser's cookie DB (and keychain/DPAPI decryption)
+        # blocks; keep it off the event loop so other tool calls carry on
+        cookies = await asyncio.to_thread(get_google_cookies, force_refresh=True)
         return (
             f"✅ Google session refreshed. "
             f"Found {len(cookies)} cookies from Chrome. "
@@ -1181,8 +1298,22 @@ async def refresh_google_session() -> str:
 # ─── Entry Point ──────────────────────────────────────────────────────────────
 
 def main() -> None:
-    """Entry point for uvx / pip installation."""
-    mcp.run()
+    """
+    Entry point for uvx / pip installation.
+
+    Runs on uvloop when it is installed (the `fast` extra, Linux/macOS);
+    every tool call is a chain of awaits on stdio and HTTP, so a faster
+    event loop shaves overhead off each one. Falls back to plain asyncio.
+    """
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+        return
+
+    import anyio
+
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":